@@ -1,3 +1,4 @@
+import hashlib
 import os
 from pathlib import Path
 
@@ -22,3 +23,13 @@ INLOAD_DOCS_PATH = VAULT_PATH / "_inload/docs"
 
 # Backwards compat for older code that expects VAULT_BASE_PATH
 VAULT_BASE_PATH = VAULT_PATH
+
+# --- App cache directory (derived indexes, kept outside the vault so they never sync with it) ---
+# Priority:
+# 1. FLATDROP_CACHE_DIR (manual override)
+# 2. Otherwise -> a per-vault folder under the user cache dir ($XDG_CACHE_HOME or ~/.cache)
+CACHE_DIR = Path(
+    os.getenv("FLATDROP_CACHE_DIR")
+    or Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "flatdrop"
+    / f"{VAULT_PATH.name}-{hashlib.sha1(str(VAULT_PATH).encode()).hexdigest()[:8]}"
+)
@@ -6,12 +6,34 @@ import re
 from pathlib import Path
 from collections import defaultdict, Counter
 from datetime import datetime
+from functools import cached_property
 import json
 
+# Marker vocabularies, compiled once - every marker is a whole-word, case-insensitive match
+CONTENT_MARKER_PATTERNS = tuple((name, re.compile(pattern, re.I)) for name, pattern in (
+    ('memoir_markers', r'\b(I remember|years ago|childhood|growing up|my father|my mother)\b'),
+    ('recovery_markers', r'\b(AA|recovery|sobriety|step work|sponsor|meeting|clean time)\b'),
+    ('job_markers', r'\b(interview|resume|job|employment|salary|work|career|application)\b'),
+    ('ai_markers', r'\b(nyx|chatgpt|AI|prompt|assistant|LLM|claude)\b'),
+    ('medical_markers', r'\b(mayo|doctor|medical|therapy|health|cirrhosis|treatment)\b'),
+    ('technical_markers', r'\b(API|code|system|database|server|function|class)\b'),
+    ('creative_markers', r'\b(art|music|draw|design|image|creative|story|poem)\b'),
+    ('emotional_markers', r'\b(fear|anxiety|depression|trauma|anger|grief|pain|joy)\b')
+))
+
+TESSERACT_HINT_PATTERNS = tuple((name, re.compile(pattern, re.I)) for name, pattern in (
+    ('structure_hints', r'\b(archetype|protocol|shadowcast|expansion|summoning)\b'),
+    ('purpose_hints', r'\b(tell.story|help.addict|prevent.death|financial.amends|help.world)\b'),
+    ('transmission_hints', r'\b(narrative|text|image|tarot|invocation)\b')
+))
+
+# Signatures of unchanged files, shared by every miner instance (each endpoint builds a fresh miner)
+# (vault path, file path) -> (st_mtime_ns, st_size, signature)
+_signature_cache = {}
+
 class InloadContentMiner:
     def __init__(self, vault_path):
         self.vault_path = Path(vault_path)
-        self.inload_dirs = list(self.vault_path.rglob("*inload*"))
         self.content_signatures = {}
         self.mining_results = {
             "high_value": [],
@@ -24,6 +46,11 @@ class InloadContentMiner:
             "archive_candidates": []
         }
         
+    @cached_property
+    def inload_dirs(self):
+        """Every *inload* path in the vault - walked on first use, so single-file signatures skip it"""
+        return list(self.vault_path.rglob("*inload*"))
+    
     def extract_content_signature(self, file_path):
         """Generate content fingerprint without full processing"""
         try:
@@ -35,21 +62,12 @@ class InloadContentMiner:
             
             # Content pattern detection
             patterns = {
-                'memoir_markers': len(re.findall(r'\b(I remember|years ago|childhood|growing up|my father|my mother)\b', content, re.I)),
-                'recovery_markers': len(re.findall(r'\b(AA|recovery|sobriety|step work|sponsor|meeting|clean time)\b', content, re.I)),
-                'job_markers': len(re.findall(r'\b(interview|resume|job|employment|salary|work|career|application)\b', content, re.I)),
-                'ai_markers': len(re.findall(r'\b(nyx|chatgpt|AI|prompt|assistant|LLM|claude)\b', content, re.I)),
-                'medical_markers': len(re.findall(r'\b(mayo|doctor|medical|therapy|health|cirrhosis|treatment)\b', content, re.I)),
-                'technical_markers': len(re.findall(r'\b(API|code|system|database|server|function|class)\b', content, re.I)),
-                'creative_markers': len(re.findall(r'\b(art|music|draw|design|image|creative|story|poem)\b', content, re.I)),
-                'emotional_markers': len(re.findall(r'\b(fear|anxiety|depression|trauma|anger|grief|pain|joy)\b', content, re.I))
+                name: len(pattern.findall(content)) for name, pattern in CONTENT_MARKER_PATTERNS
             }
             
             # Tesseract coordinate hints
             tesseract_hints = {
-                'structure_hints': len(re.findall(r'\b(archetype|protocol|shadowcast|expansion|summoning)\b', content, re.I)),
-                'purpose_hints': len(re.findall(r'\b(tell.story|help.addict|prevent.death|financial.amends|help.world)\b', content, re.I)),
-                'transmission_hints': len(re.findall(r'\b(narrative|text|image|tarot|invocation)\b', content, re.I))
+                name: len(pattern.findall(content)) for name, pattern in TESSERACT_HINT_PATTERNS
             }
             
             # Quality indicators
@@ -70,6 +88,23 @@ class InloadContentMiner:
         except Exception as e:
             return {'file_path': str(file_path), 'error': str(e)}
     
+    def cached_content_signature(self, file_path):
+        """Content signature, reused until the file's mtime or size changes"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return self.extract_content_signature(file_path)
+        
+        key = (str(self.vault_path), str(file_path))
+        cached = _signature_cache.get(key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        signature = self.extract_content_signature(file_path)
+        if 'error' not in signature:
+            _signature_cache[key] = (stat.st_mtime_ns, stat.st_size, signature)
+        return signature
+    
     def is_snippet_file_by_signature(self, signature):
         """Check if file signature indicates it's a snippet file"""
         try:
@@ -149,13 +184,16 @@ class InloadContentMiner:
         print(f"🔍 Scanning {len(self.inload_dirs)} _inload directories...")
         
         total_files = 0
+        scanned = set()
         for inload_dir in self.inload_dirs:
             if inload_dir.is_dir():
                 md_files = list(inload_dir.rglob("*.md"))
                 print(f"📁 {inload_dir.name}: {len(md_files)} markdown files")
                 
                 for md_file in md_files:
-                    signature = self.extract_content_signature(md_file)
+                    # Only new or modified files are re-read
+                    signature = self.cached_content_signature(md_file)
+                    scanned.add((str(self.vault_path), str(md_file)))
                     if 'error' not in signature:
                         self.content_signatures[signature['file_path']] = signature
                         total_files += 1
@@ -163,6 +201,11 @@ class InloadContentMiner:
                         if total_files % 50 == 0:
                             print(f"   Processed {total_files} files...")
         
+        # Forget files that have left the _inload directories
+        vault_key = str(self.vault_path)
+        for key in [key for key in _signature_cache if key[0] == vault_key and key not in scanned]:
+            del _signature_cache[key]
+        
         print(f"✅ Total files processed: {total_files}")
         return self.content_signatures
     
@@ -143,41 +143,48 @@ class ParentPieceClusterer:
         clusters = []
         processed = set()
         
+        # Per-chunk columns for the pairwise pass - entities are extracted once per chunk,
+        # not once per pair
+        chunk_ids = [chunk['chunk_id'] for chunk in chunks]
+        chunk_coordinates = [chunk['coordinates'] for chunk in chunks]
+        chunk_sources = [chunk['chunk_source'] for chunk in chunks]
+        chunk_entities = [self.extract_key_entities(chunk['body']) for chunk in chunks]
+        
         for i, chunk in enumerate(chunks):
-            if chunk['chunk_id'] in processed:
+            if chunk_ids[i] in processed:
                 continue
             
             # Start new cluster
             cluster = {
-                'seed_chunk': chunk['chunk_id'],
+                'seed_chunk': chunk_ids[i],
                 'chunks': [chunk],
                 'cluster_score': 0,
-                'coordinate_pattern': chunk['coordinates'],
-                'shared_entities': self.extract_key_entities(chunk['body']),
+                'coordinate_pattern': chunk_coordinates[i],
+                'shared_entities': set(chunk_entities[i]),
                 'date_range': [chunk.get('content_date'), chunk.get('content_date')],
                 'avg_quality': chunk['quality_score'],
                 'total_words': chunk['word_count']
             }
             
-            processed.add(chunk['chunk_id'])
+            processed.add(chunk_ids[i])
             
             # Find similar chunks
             for j, other_chunk in enumerate(chunks):
-                if i == j or other_chunk['chunk_id'] in processed:
+                if i == j or chunk_ids[j] in processed:
                     continue
                 
                 # Calculate similarity
                 coord_sim = self.calculate_coordinate_similarity(
-                    chunk['coordinates'], 
-                    other_chunk['coordinates']
+                    chunk_coordinates[i], 
+                    chunk_coordinates[j]
                 )
                 
                 # Check for shared entities
-                other_entities = self.extract_key_entities(other_chunk['body'])
+                other_entities = chunk_entities[j]
                 entity_overlap = len(cluster['shared_entities'] & other_entities)
                 
                 # Check same source file
-                same_source = chunk['chunk_source'] == other_chunk['chunk_source']
+                same_source = chunk_sources[i] == chunk_sources[j]
                 
                 # Clustering criteria
                 should_cluster = (
@@ -1,15 +1,41 @@
 from fastapi import APIRouter
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
+import asyncio
+import heapq
+import os
 import re
 import json
+import threading
+import time
 from typing import Optional, List, Dict, Any
-from fastapi.responses import HTMLResponse
-
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
+
+# orjson encodes the large analysis dicts several times faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# MessagePack output for service clients (optional - format=msgpack on the mining dashboard)
+try:
+    import ormsgpack
+    ORMSGPACK_AVAILABLE = True
+except ImportError:
+    ORMSGPACK_AVAILABLE = False
 
 from app.schemas import BatchMoveRequest
 
-router = APIRouter()
+API_RESPONSE_CLASS = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+router = APIRouter(default_response_class=API_RESPONSE_CLASS)
+
+# Full-vault passes print a progress line every this many files (stdout writes are synchronous)
+PROGRESS_PRINT_INTERVAL = 1000
 
 # Fixed imports - note the comma after VAULT_PATH and proper line continuation
 from app.utils import (
@@ -17,18 +43,20 @@ from app.utils import (
     validate_markdown, write_markdown_file, parse_yaml_frontmatter,
     fix_yaml_frontmatter, generate_obsidian_yaml, apply_tag_consolidation,
     extract_all_tags, analyze_consolidation_opportunities, create_backup_snapshot,
-    CRITICAL_CONSOLIDATIONS,
+    CRITICAL_CONSOLIDATIONS, TAG_INDEX, has_any_tag,
     VAULT_PATH,  # Add comma here
     
     # NEW: Tesseract 4D functions
     extract_tesseract_position, calculate_memoir_priority, calculate_4d_coherence,
     find_tesseract_clusters, generate_tesseract_folder_path,
+    TESSERACT_PURPOSES, TESSERACT_STRUCTURES,
     
     # NEW: Content intelligence functions
     identify_document_archetype, extract_content_signature, count_internal_references,
     analyze_folder_content_types, measure_tag_coherence, extract_naming_patterns,
     calculate_urgency_score, group_by_archetype, generate_folder_path,
-    calculate_priority, find_orphaned_files, chunked
+    calculate_priority, find_orphaned_files, chunked,
+    analyze_markdown_document, DOCUMENT_CACHE, VaultScan, scan_vault
 )
 # ============================================================================
 # TESSERACT 4D COORDINATE SYSTEM ENDPOINTS
@@ -102,10 +130,8 @@ async def get_smart_review_batch(
         'remaining_count': len(candidates) - batch_size
     }
 
-@router.get("/viz-clusters", response_class=HTMLResponse)
-async def serve_cluster_visualization():
-    """Serve the cluster view"""
-    html_content = """<!DOCTYPE html>
+# Static pages are encoded once at import; their handlers just hand out the bytes
+CLUSTER_VISUALIZATION_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -630,13 +656,19 @@ async def serve_cluster_visualization():
         document.getElementById('min-size').addEventListener('change', updateVisualization);
     </script>
 </body>
-</html>"""
-    return HTMLResponse(content=html_content)
+</html>""".encode("utf-8")
+
+@router.get("/viz-clusters", response_class=HTMLResponse)
+async def serve_cluster_visualization():
+    """Serve the cluster view"""
+    return HTMLResponse(content=CLUSTER_VISUALIZATION_HTML)
 
 
 @router.post("/api/process/incremental")
 async def run_incremental_processing(dry_run: bool = True):
     """Run incremental processing on _inload directory"""
+    from .incremental_processor import IncrementalProcessor
+    
     SOURCE_DIR = "/Users/rickshangle/Vaults/flatline-codex/_inload"
     OUTPUT_BASE = "/Users/rickshangle/Vaults/flatline-codex"
     BACKUP_DIR = "/Users/rickshangle/Vaults/flatline-codex/_backups"
@@ -644,16 +676,15 @@ async def run_incremental_processing(dry_run: bool = True):
     
     processor = IncrementalProcessor(SOURCE_DIR, OUTPUT_BASE, BACKUP_DIR, PROCESSED_LOG)
     results = processor.process_new_files(dry_run=dry_run)
+    if not dry_run:
+        invalidate_tesseract_cache()
     
     return results
 
 
 
-@router.get("/viz", response_class=HTMLResponse)
-async def serve_tesseract_visualization():
-    """Serve the Tesseract 4D visualization directly from the API (bypasses CORS)"""
-    
-    html_content = """<!DOCTYPE html>
+# Static page, encoded once at import
+TESSERACT_VISUALIZATION_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1297,9 +1328,12 @@ async def serve_tesseract_visualization():
         });
     </script>
 </body>
-</html>"""
-    
-    return HTMLResponse(content=html_content)
+</html>""".encode("utf-8")
+
+@router.get("/viz", response_class=HTMLResponse)
+async def serve_tesseract_visualization():
+    """Serve the Tesseract 4D visualization directly from the API (bypasses CORS)"""
+    return HTMLResponse(content=TESSERACT_VISUALIZATION_HTML)
 @router.get("/api/training/summary")
 async def get_training_summary():
     """Get overall training results summary from the 30-file analysis"""
@@ -1718,8 +1752,8 @@ def get_top_themes(theme_distribution: dict, limit: int = 3) -> list:
     if not theme_distribution:
         return []
     
-    sorted_themes = sorted(theme_distribution.items(), key=lambda x: x[1], reverse=True)
-    return [theme[0] for theme in sorted_themes[:limit]]
+    top_themes = heapq.nlargest(limit, theme_distribution.items(), key=lambda x: x[1])
+    return [theme[0] for theme in top_themes]
 
 def calculate_overall_batch_stats(batch_summaries: list) -> dict:
     """Calculate overall statistics across all batches"""
@@ -1764,7 +1798,7 @@ def analyze_batch_chunks(chunks_data: list) -> dict:
             "max": max(word_counts) if word_counts else 0,
             "avg": round(sum(word_counts) / len(word_counts), 1) if word_counts else 0
         },
-        "high_quality_chunks": len([q for q in qualities if q > 70])
+        "high_quality_chunks": sum(1 for q in qualities if q > 70)
     }
 
 def generate_pattern_recommendations(effective_patterns: list) -> list:
@@ -1933,6 +1967,11 @@ async def final_consolidation_cleanup(dry_run: bool = True):
     
     for md_file in VAULT_PATH.rglob("*.md"):
         try:
+            # Common case: none of the file's indexed tags are affected - skip the read and YAML parse
+            if not has_any_tag(md_file, final_cleanup_mappings):
+                files_processed += 1
+                continue
+            
             content = md_file.read_text(encoding="utf-8")
             if content.startswith("---"):
                 yaml_data = parse_yaml_frontmatter(content)
@@ -1969,6 +2008,7 @@ async def final_consolidation_cleanup(dry_run: bool = True):
                                     new_yaml = generate_obsidian_yaml(yaml_data)
                                     updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
                                     md_file.write_text(updated_content, encoding="utf-8")
+                                    invalidate_tesseract_cache()
             
             files_processed += 1
             
@@ -1986,42 +2026,39 @@ async def final_consolidation_cleanup(dry_run: bool = True):
         "message": "Preview mode - no files changed" if dry_run else "Final consolidation cleanup completed"
     }
 
+# Remaining-issue patterns, each compiled into one alternation so a tag is scanned once per category
+COORDINATE_REDUNDANT_PATTERN = re.compile("|".join(map(re.escape, [
+    "ritual", "chaos", "tarot", "protocol", "archetype", "narrative", "shadowcast"
+])))
+FORMAT_ISSUE_PATTERN = re.compile("|".join(map(re.escape, ["thread-dump", "_import", "ritual/", "colors/"])))
+TECHNICAL_ARTIFACT_PATTERN = re.compile("|".join(map(re.escape, ["111", "222", "320", "102", "220", "REMOVE_"])))
+
 # Add endpoint to verify consolidation completion
 @router.get("/api/tags/consolidation-status")
 async def check_consolidation_status():
     """Check the current status of tag consolidation and identify remaining issues"""
     
     # Get current tag state
-    tag_counter = Counter()
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception:
-            continue
+    tag_counter = TAG_INDEX.counts()
     
     # Check for remaining consolidation targets
     remaining_coordinate_redundant = []
     remaining_format_issues = []
     remaining_technical_artifacts = []
     
-    coordinate_redundant_patterns = ["ritual", "chaos", "tarot", "protocol", "archetype", "narrative", "shadowcast"]
-    format_issue_patterns = ["thread-dump", "_import", "ritual/", "colors/"]
-    technical_artifact_patterns = [111, 222, 320, 102, 220, "REMOVE_"]
-    
     for tag, count in tag_counter.items():
         tag_str = str(tag)
         
         # Check coordinate redundancy
-        if any(pattern in tag_str for pattern in coordinate_redundant_patterns):
+        if COORDINATE_REDUNDANT_PATTERN.search(tag_str):
             remaining_coordinate_redundant.append({"tag": tag, "count": count})
         
         # Check format issues
-        elif any(pattern in tag_str for pattern in format_issue_patterns):
+        elif FORMAT_ISSUE_PATTERN.search(tag_str):
             remaining_format_issues.append({"tag": tag, "count": count})
         
         # Check technical artifacts
-        elif any(str(pattern) in tag_str for pattern in technical_artifact_patterns):
+        elif TECHNICAL_ARTIFACT_PATTERN.search(tag_str):
             remaining_technical_artifacts.append({"tag": tag, "count": count})
     
     # Calculate consolidation completeness
@@ -2086,6 +2123,7 @@ async def consolidate_tesseract_redundant_tags(dry_run: bool = True):
             
             if file_changes and not dry_run:
                 md_file.write_text(updated_content, encoding="utf-8")
+                invalidate_tesseract_cache()
                 
             files_processed += 1
             tags_removed += len(file_changes)
@@ -2108,13 +2146,7 @@ async def consolidate_singletons(dry_run: bool = True):
     """Consolidate singleton tags into established tags for semantic compression"""
     
     # Get current tag counts
-    tag_counter = Counter()
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception:
-            continue
+    tag_counter = TAG_INDEX.counts()
     
     # Identify singletons and established tags
     singletons = [tag for tag, count in tag_counter.items() if count == 1]
@@ -2173,6 +2205,11 @@ async def consolidate_singletons(dry_run: bool = True):
     
     for md_file in VAULT_PATH.rglob("*.md"):
         try:
+            # Common case: none of the file's indexed tags are affected - skip the read and YAML parse
+            if not has_any_tag(md_file, consolidation_map):
+                files_processed += 1
+                continue
+            
             content = md_file.read_text(encoding="utf-8")
             if content.startswith("---"):
                 yaml_data = parse_yaml_frontmatter(content)
@@ -2202,6 +2239,7 @@ async def consolidate_singletons(dry_run: bool = True):
                                     new_yaml = generate_obsidian_yaml(yaml_data)
                                     updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
                                     md_file.write_text(updated_content, encoding="utf-8")
+                                    invalidate_tesseract_cache()
             
             files_processed += 1
             
@@ -2370,13 +2408,7 @@ async def execute_singleton_consolidation(dry_run: bool = True):
     """Execute singleton consolidation with corrected therapeutic content mapping"""
     
     # Get current tag counts
-    tag_counter = Counter()
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception:
-            continue
+    tag_counter = TAG_INDEX.counts()
     
     # Identify singletons
     singletons = [tag for tag, count in tag_counter.items() if count == 1]
@@ -2418,6 +2450,11 @@ async def execute_singleton_consolidation(dry_run: bool = True):
     
     for md_file in VAULT_PATH.rglob("*.md"):
         try:
+            # Common case: none of the file's indexed tags are affected - skip the read and YAML parse
+            if not has_any_tag(md_file, consolidation_map):
+                files_processed += 1
+                continue
+            
             content = md_file.read_text(encoding="utf-8")
             if content.startswith("---"):
                 yaml_data = parse_yaml_frontmatter(content)
@@ -2447,6 +2484,7 @@ async def execute_singleton_consolidation(dry_run: bool = True):
                                     new_yaml = generate_obsidian_yaml(yaml_data)
                                     updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
                                     md_file.write_text(updated_content, encoding="utf-8")
+                                    invalidate_tesseract_cache()
             
             files_processed += 1
             
@@ -2523,9 +2561,15 @@ async def execute_technical_cleanup(dry_run: bool = True):
     total_removals = 0
     total_consolidations = 0
     changes_made = []
+    affected_tags = TECHNICAL_REMOVALS.keys() | FORMAT_CONSOLIDATIONS.keys()
     
     for md_file in VAULT_PATH.rglob("*.md"):
         try:
+            # Common case: none of the file's indexed tags are affected - skip the read and YAML parse
+            if not has_any_tag(md_file, affected_tags):
+                files_processed += 1
+                continue
+            
             content = md_file.read_text(encoding="utf-8")
             if content.startswith("---"):
                 yaml_data = parse_yaml_frontmatter(content)
@@ -2563,6 +2607,7 @@ async def execute_technical_cleanup(dry_run: bool = True):
                                     new_yaml = generate_obsidian_yaml(yaml_data)
                                     updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
                                     md_file.write_text(updated_content, encoding="utf-8")
+                                    invalidate_tesseract_cache()
             
             files_processed += 1
             
@@ -2585,13 +2630,7 @@ async def identify_tag_reduction_candidates():
     """Identify specific tags for reduction using strategic criteria"""
     
     # Get current tag counts
-    tag_counter = Counter()
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception:
-            continue
+    tag_counter = TAG_INDEX.counts()
     
     reduction_candidates = {
         "technical_artifacts": [],
@@ -2713,13 +2752,7 @@ async def analyze_singleton_tags():
     """Analyze singleton tags to categorize by value and identify cleanup opportunities"""
     
     # Get current tag counts
-    tag_counter = Counter()
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception:
-            continue
+    tag_counter = TAG_INDEX.counts()
     
     # Identify singletons (tags appearing exactly once)
     singletons = [tag for tag, count in tag_counter.items() if count == 1]
@@ -2813,6 +2846,11 @@ async def cleanup_consolidation_artifacts(dry_run: bool = True):
     
     for md_file in VAULT_PATH.rglob("*.md"):
         try:
+            # Common case: none of the file's indexed tags are affected - skip the read and YAML parse
+            if not has_any_tag(md_file, PLACEHOLDER_REMOVALS):
+                files_processed += 1
+                continue
+            
             content = md_file.read_text(encoding="utf-8")
             if content.startswith("---"):
                 yaml_data = parse_yaml_frontmatter(content)
@@ -2833,6 +2871,7 @@ async def cleanup_consolidation_artifacts(dry_run: bool = True):
                                     new_yaml = generate_obsidian_yaml(yaml_data)
                                     updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
                                     md_file.write_text(updated_content, encoding="utf-8")
+                                    invalidate_tesseract_cache()
             
             files_processed += 1
             
@@ -2849,15 +2888,8 @@ async def cleanup_consolidation_artifacts(dry_run: bool = True):
 @router.get("/api/tags/audit")
 async def audit_tags():
     """Comprehensive tag analysis"""
-    tag_counter = Counter()
-    
-    # Collect all tags from all files
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            tags = extract_all_tags(md_file)
-            tag_counter.update(tags)
-        except Exception as e:
-            print(f"Error processing {md_file}: {e}")
+    # Collect all tags from all files (re-reads only files changed since last call)
+    tag_counter = TAG_INDEX.counts()
     
     return {
         "total_tags": len(tag_counter),
@@ -2866,6 +2898,81 @@ async def audit_tags():
         "unique_tags": list(tag_counter.keys())
     }
 
+# ============================================================================
+# TESSERACT ANALYSIS CACHE
+# ============================================================================
+
+# Full-vault 4D passes are expensive; keep results briefly so the reorganization
+# and memoir-readiness endpoints don't re-scan the vault on every request.
+TESSERACT_CACHE_TTL = 60  # seconds
+
+_tesseract_cache = {}
+_tesseract_cache_locks = defaultdict(asyncio.Lock)
+_corpus_version = 0
+
+def invalidate_tesseract_cache():
+    """Drop cached Tesseract results after the vault has been modified"""
+    global _corpus_version
+    _corpus_version += 1
+    _tesseract_cache.clear()
+
+async def _cached_tesseract_analysis(name: str, compute, fingerprint=None) -> dict:
+    """Return a cached Tesseract analysis, recomputing on expiry, vault writes or a fingerprint change"""
+    key = (name, _corpus_version, fingerprint)
+    
+    cached = _tesseract_cache.get(key)
+    if cached and time.monotonic() - cached[0] < TESSERACT_CACHE_TTL:
+        return cached[1]
+    
+    # One recompute per analysis; concurrent callers wait for its result
+    async with _tesseract_cache_locks[name]:
+        cached = _tesseract_cache.get(key)
+        if cached and time.monotonic() - cached[0] < TESSERACT_CACHE_TTL:
+            return cached[1]
+        
+        result = await compute()
+        if "error" not in result and key[1] == _corpus_version:
+            # One live entry per analysis - drop results for superseded fingerprints
+            for stale_key in [k for k in _tesseract_cache if k[0] == name]:
+                del _tesseract_cache[stale_key]
+            _tesseract_cache[key] = (time.monotonic(), result)
+        return result
+
+async def _vault_fingerprint() -> int:
+    """Fingerprint of the vault as it is now - a stat walk, far cheaper than re-reading every note"""
+    return (await asyncio.to_thread(scan_vault, VAULT_PATH)).fingerprint
+
+async def _cached_tesseract_coordinates(fingerprint: int = None) -> dict:
+    if fingerprint is None:
+        fingerprint = await _vault_fingerprint()
+    return await _cached_tesseract_analysis("coordinates", extract_tesseract_coordinates, fingerprint)
+
+async def _cached_tesseract_structure(fingerprint: int = None) -> dict:
+    if fingerprint is None:
+        fingerprint = await _vault_fingerprint()
+    return await _cached_tesseract_analysis("structure", analyze_tesseract_structure, fingerprint)
+
+# Files per purpose for the cached coordinate map: (coordinates result it indexes, index).
+# Kept beside the cache rather than in the response, so clients never see it
+_purpose_index_cache = {}
+
+def tesseract_purpose_index(coordinates_result: dict) -> dict:
+    """z_purpose -> file paths (extraction order), built once per cached coordinates result"""
+    cached = _purpose_index_cache.get("coordinates")
+    if cached is not None and cached[0] is coordinates_result:
+        return cached[1]
+    
+    index = defaultdict(list)
+    for file_path, coordinates in coordinates_result["coordinate_combinations"].items():
+        index[coordinates["z_purpose"]].append(file_path)
+    index = dict(index)
+    _purpose_index_cache["coordinates"] = (coordinates_result, index)
+    return index
+
+async def _cached_vault_analysis(name: str, compute, scan: VaultScan) -> dict:
+    """Full-vault analyses of a shared scan, keyed on its fingerprint so edits made outside the API also invalidate them"""
+    return await _cached_tesseract_analysis(name, lambda: compute(scan), scan.fingerprint)
+
 @router.post("/api/tesseract/extract-coordinates")
 async def extract_tesseract_coordinates():
     """Map entire codex into 4D Tesseract coordinate system"""
@@ -2909,7 +3016,7 @@ async def extract_tesseract_coordinates():
             processed_files += 1
             
             # Progress tracking
-            if processed_files % 50 == 0:
+            if processed_files % PROGRESS_PRINT_INTERVAL == 0:
                 print(f"Processed {processed_files} files into 4D space...")
                 
         except Exception as e:
@@ -2963,15 +3070,19 @@ async def analyze_tesseract_structure():
         "coordinate_clusters": {},
         "organizational_gaps": {},
         "memoir_readiness_by_purpose": {},
-        "4d_reorganization_opportunities": []
+        "4d_reorganization_opportunities": [],
+        "4d_orphans": []
     }
     
+    # One stat walk gives the folder layout and the fingerprint the coordinate map is cached under
+    scan = await asyncio.to_thread(scan_vault, VAULT_PATH)
+    
     # Get current tesseract mapping
     try:
-        tesseract_map_result = await extract_tesseract_coordinates()
+        tesseract_map_result = await _cached_tesseract_coordinates(scan.fingerprint)
         tesseract_map = {
             "coordinate_combinations": tesseract_map_result["coordinate_combinations"],
-            "z_purpose_distribution": Counter(tesseract_map_result["dimensional_distributions"]["z_purpose"]),
+            "z_purpose_distribution": tesseract_map_result["dimensional_distributions"]["z_purpose"],
             "memoir_spine_candidates": tesseract_map_result["memoir_spine_analysis"]["high_priority_spine"]
         }
     except Exception as e:
@@ -2979,31 +3090,49 @@ async def analyze_tesseract_structure():
     
     processed_folders = 0
     
-    for folder_path in VAULT_PATH.rglob("*"):
-        if folder_path.is_dir() and not folder_path.name.startswith('.'):
-            md_files = list(folder_path.glob("*.md"))
-            if md_files:
-                
-                # Analyze 4D coherence within folder
-                folder_coordinates = []
-                for md_file in md_files:
-                    file_key = str(md_file.relative_to(VAULT_PATH))
-                    if file_key in tesseract_map["coordinate_combinations"]:
-                        folder_coordinates.append(tesseract_map["coordinate_combinations"][file_key])
-                
-                coherence_score = calculate_4d_coherence(folder_coordinates)
-                dominant_coordinates = find_dominant_4d_pattern(folder_coordinates)
-                
-                folder_key = str(folder_path.relative_to(VAULT_PATH))
-                tesseract_analysis["dimensional_coherence"][folder_key] = {
-                    "file_count": len(md_files),
-                    "4d_coherence_score": coherence_score,
-                    "dominant_pattern": dominant_coordinates,
-                    "scatter_analysis": analyze_coordinate_scatter(folder_coordinates),
-                    "reorganization_urgency": calculate_4d_urgency(coherence_score, len(md_files))
-                }
-                
-                processed_folders += 1
+    # Folders in rglob("*") order from the scan, coordinates from the map - no re-reading or re-globbing
+    coordinate_combinations = tesseract_map["coordinate_combinations"]
+    coherence_scores = []  # unrounded, for the average
+    for folder in scan.folder_order:
+        folder_path = Path(folder)
+        md_files = scan.md_files_by_folder.get(folder)
+        if not md_files or folder_path.name.startswith('.'):
+            continue
+        
+        # Analyze 4D coherence within folder (files that failed to map have no coordinates)
+        folder_coordinates = []
+        for md_file in md_files:
+            coordinates = coordinate_combinations.get(str(md_file.relative_to(VAULT_PATH)))
+            if coordinates is not None:
+                folder_coordinates.append(coordinates)
+        
+        file_count = len(md_files)
+        coherence_score = calculate_4d_coherence(folder_coordinates)
+        coherence_scores.append(coherence_score)
+        dimension_counts = count_4d_dimensions(folder_coordinates)
+        dominant_coordinates = find_dominant_4d_pattern(folder_coordinates, dimension_counts)
+        scatter_analysis = analyze_coordinate_scatter(folder_coordinates, dimension_counts)
+        
+        folder_key = str(folder_path.relative_to(VAULT_PATH))
+        tesseract_analysis["dimensional_coherence"][folder_key] = {
+            "file_count": file_count,
+            "4d_coherence_score": round(coherence_score, 3),
+            "dominant_pattern": dominant_coordinates,
+            "scatter_analysis": scatter_analysis,
+            "reorganization_urgency": calculate_4d_urgency(coherence_score, file_count)
+        }
+        
+        # Flag 4D orphans here so find_4d_orphans needs no second folder pass
+        scatter_score = scatter_analysis["scatter_score"]
+        if coherence_score < 0.3 and scatter_score > 0.7:
+            tesseract_analysis["4d_orphans"].append({
+                "folder": folder_key,
+                "file_count": file_count,
+                "coherence_issue": "high_scatter",
+                "scatter_score": scatter_score
+            })
+        
+        processed_folders += 1
     
     # Identify cross-dimensional clusters that should be grouped
     tesseract_analysis["coordinate_clusters"] = tesseract_map_result["4d_clusters"]
@@ -3014,26 +3143,40 @@ async def analyze_tesseract_structure():
     return {
         "analysis_summary": {
             "folders_analyzed": processed_folders,
-            "avg_4d_coherence": calculate_avg_coherence(tesseract_analysis["dimensional_coherence"]),
-            "high_coherence_folders": len([
-                f for f in tesseract_analysis["dimensional_coherence"].values()
+            "avg_4d_coherence": calculate_avg_coherence(coherence_scores),
+            "high_coherence_folders": sum(
+                1 for f in tesseract_analysis["dimensional_coherence"].values()
                 if f["4d_coherence_score"] > 0.7
-            ])
+            )
         },
         "tesseract_structure_analysis": tesseract_analysis,
         "reorganization_recommendations": generate_4d_reorganization_recommendations(tesseract_analysis)
     }
 
-def find_dominant_4d_pattern(coordinates_list: list) -> dict:
+def count_4d_dimensions(coordinates_list: list) -> tuple:
+    """Tally each dimension's values in one pass over a folder's coordinates"""
+    structure_counter = Counter()
+    transmission_counter = Counter()
+    purpose_counter = Counter()
+    terrain_counter = Counter()
+    
+    for coord in coordinates_list:
+        structure_counter[coord["x_structure"]] += 1
+        transmission_counter[coord["y_transmission"]] += 1
+        purpose_counter[coord["z_purpose"]] += 1
+        terrain_counter[coord["w_terrain"]] += 1
+    
+    return structure_counter, transmission_counter, purpose_counter, terrain_counter
+
+def find_dominant_4d_pattern(coordinates_list: list, dimension_counts: tuple = None) -> dict:
     """Find the dominant coordinate pattern in a folder"""
     if not coordinates_list:
         return {}
     
     # Count occurrences of each dimension value
-    structure_counter = Counter(coord["x_structure"] for coord in coordinates_list)
-    transmission_counter = Counter(coord["y_transmission"] for coord in coordinates_list)
-    purpose_counter = Counter(coord["z_purpose"] for coord in coordinates_list)
-    terrain_counter = Counter(coord["w_terrain"] for coord in coordinates_list)
+    structure_counter, transmission_counter, purpose_counter, terrain_counter = (
+        dimension_counts or count_4d_dimensions(coordinates_list)
+    )
     
     return {
         "dominant_structure": structure_counter.most_common(1)[0][0] if structure_counter else "none",
@@ -3048,7 +3191,7 @@ def find_dominant_4d_pattern(coordinates_list: list) -> dict:
         }
     }
 
-def analyze_coordinate_scatter(coordinates_list: list) -> dict:
+def analyze_coordinate_scatter(coordinates_list: list, dimension_counts: tuple = None) -> dict:
     """Analyze how scattered coordinates are across 4D space"""
     if not coordinates_list:
         return {"scatter_score": 0, "analysis": "No coordinates to analyze"}
@@ -3056,10 +3199,9 @@ def analyze_coordinate_scatter(coordinates_list: list) -> dict:
     total_files = len(coordinates_list)
     
     # Count unique values in each dimension
-    unique_structures = len(set(coord["x_structure"] for coord in coordinates_list))
-    unique_transmissions = len(set(coord["y_transmission"] for coord in coordinates_list))
-    unique_purposes = len(set(coord["z_purpose"] for coord in coordinates_list))
-    unique_terrains = len(set(coord["w_terrain"] for coord in coordinates_list))
+    unique_structures, unique_transmissions, unique_purposes, unique_terrains = (
+        len(counter) for counter in (dimension_counts or count_4d_dimensions(coordinates_list))
+    )
     
     # Calculate scatter (higher = more scattered)
     scatter_score = (unique_structures + unique_transmissions + unique_purposes + unique_terrains) / (4 * total_files)
@@ -3097,47 +3239,44 @@ def assess_memoir_completeness_by_purpose(tesseract_map: dict) -> dict:
     """Assess memoir readiness across Rick's 5 core purposes"""
     purpose_analysis = {}
     
-    for purpose in ["tell-story", "help-addict", "prevent-death-poverty", "financial-amends", "help-world"]:
-        purpose_files = [
-            file_path for file_path, coords in tesseract_map["coordinate_combinations"].items()
-            if coords["z_purpose"] == purpose
-        ]
-        
-        # Analyze transmission modes for this purpose
-        transmission_counts = Counter()
-        terrain_counts = Counter()
-        
-        for file_path in purpose_files:
-            coords = tesseract_map["coordinate_combinations"][file_path]
-            transmission_counts[coords["y_transmission"]] += 1
-            terrain_counts[coords["w_terrain"]] += 1
+    # Single pass over the coordinates, tallying transmission/terrain per purpose
+    purpose_tallies = defaultdict(lambda: {"transmission": Counter(), "terrain": Counter(), "files": []})
+    for file_path, coords in tesseract_map["coordinate_combinations"].items():
+        tally = purpose_tallies[coords["z_purpose"]]
+        tally["transmission"][coords["y_transmission"]] += 1
+        tally["terrain"][coords["w_terrain"]] += 1
+        tally["files"].append(file_path)
+    
+    for purpose in TESSERACT_PURPOSES:
+        tally = purpose_tallies[purpose]
+        transmission_counts = tally["transmission"]
+        terrain_counts = tally["terrain"]
+        purpose_files = tally["files"]
         
         purpose_analysis[purpose] = {
             "total_files": len(purpose_files),
-            "narrative_files": transmission_counts.get("narrative", 0),
+            "narrative_files": transmission_counts["narrative"],
             "transmission_diversity": len(transmission_counts),
             "cognitive_terrains": dict(terrain_counts),
-            "memoir_readiness": calculate_purpose_memoir_readiness(purpose, transmission_counts, terrain_counts),
+            "memoir_readiness": calculate_purpose_memoir_readiness(purpose, transmission_counts, terrain_counts, len(purpose_files)),
             "sample_files": purpose_files[:10]
         }
     
     return purpose_analysis
 
-def calculate_purpose_memoir_readiness(purpose: str, transmission_counts: Counter, terrain_counts: Counter) -> dict:
-    """Calculate memoir readiness for each life purpose"""
-    narrative_count = transmission_counts.get("narrative", 0)
-    total_files = sum(transmission_counts.values())
-    
-    # Different purposes have different memoir requirements
-    purpose_weights = {
-        "tell-story": {"narrative_importance": 0.8, "min_files": 20},
-        "help-addict": {"narrative_importance": 0.6, "min_files": 15},
-        "prevent-death-poverty": {"narrative_importance": 0.4, "min_files": 10},
-        "financial-amends": {"narrative_importance": 0.3, "min_files": 5},
-        "help-world": {"narrative_importance": 0.5, "min_files": 10}
-    }
-    
-    weights = purpose_weights.get(purpose, {"narrative_importance": 0.5, "min_files": 10})
+# Different purposes have different memoir requirements
+PURPOSE_MEMOIR_WEIGHTS = {
+    "tell-story": {"narrative_importance": 0.8, "min_files": 20},
+    "help-addict": {"narrative_importance": 0.6, "min_files": 15},
+    "prevent-death-poverty": {"narrative_importance": 0.4, "min_files": 10},
+    "financial-amends": {"narrative_importance": 0.3, "min_files": 5},
+    "help-world": {"narrative_importance": 0.5, "min_files": 10}
+}
+DEFAULT_PURPOSE_MEMOIR_WEIGHTS = {"narrative_importance": 0.5, "min_files": 10}
+
+def calculate_purpose_readiness_scores(purpose: str, narrative_count: int, total_files: int, terrain_types: int) -> tuple:
+    """Unrounded (overall, volume, narrative, narrative ratio) memoir readiness for one life purpose"""
+    weights = PURPOSE_MEMOIR_WEIGHTS.get(purpose, DEFAULT_PURPOSE_MEMOIR_WEIGHTS)
     
     # Calculate readiness score
     volume_score = min(1.0, total_files / weights["min_files"])
@@ -3145,9 +3284,19 @@ def calculate_purpose_memoir_readiness(purpose: str, transmission_counts: Counte
     narrative_score = narrative_ratio * weights["narrative_importance"]
     
     # Bonus for diverse cognitive terrains (shows depth)
-    terrain_diversity = len(terrain_counts) / 5  # Max 5 terrain types
+    terrain_diversity = terrain_types / 5  # Max 5 terrain types
     
     overall_readiness = (volume_score + narrative_score + terrain_diversity * 0.2) / 2
+    return overall_readiness, volume_score, narrative_score, narrative_ratio
+
+def calculate_purpose_memoir_readiness(purpose: str, transmission_counts: Counter, terrain_counts: Counter, total_files: int = None) -> dict:
+    """Calculate memoir readiness for each life purpose"""
+    if total_files is None:
+        total_files = sum(transmission_counts.values())
+    
+    overall_readiness, volume_score, narrative_score, narrative_ratio = calculate_purpose_readiness_scores(
+        purpose, transmission_counts["narrative"], total_files, len(terrain_counts)
+    )
     
     return {
         "readiness_score": round(overall_readiness, 3),
@@ -3157,6 +3306,14 @@ def calculate_purpose_memoir_readiness(purpose: str, transmission_counts: Counte
         "recommendations": generate_purpose_recommendations(purpose, volume_score, narrative_score, terrain_counts)
     }
 
+PURPOSE_SPECIFIC_RECS = {
+    "tell-story": ("Focus on chronological narrative", "Add more personal details and memories"),
+    "help-addict": ("Include specific recovery experiences", "Document sponsor relationships and meeting insights"),
+    "prevent-death-poverty": ("Chronicle health challenges and housing struggles", "Document practical survival strategies"),
+    "financial-amends": ("Detail work history and financial recovery", "Include specific amends and responsibility steps"),
+    "help-world": ("Connect creative work to larger purpose", "Document how systems and tools help others")
+}
+
 def generate_purpose_recommendations(purpose: str, volume_score: float, narrative_score: float, terrain_counts: Counter) -> list:
     """Generate specific recommendations for improving purpose-based memoir readiness"""
     recommendations = []
@@ -3171,57 +3328,50 @@ def generate_purpose_recommendations(purpose: str, volume_score: float, narrativ
         recommendations.append(f"Add emotional depth - explore '{purpose}' across different cognitive terrains")
     
     # Purpose-specific recommendations
-    purpose_specific = {
-        "tell-story": ["Focus on chronological narrative", "Add more personal details and memories"],
-        "help-addict": ["Include specific recovery experiences", "Document sponsor relationships and meeting insights"],
-        "prevent-death-poverty": ["Chronicle health challenges and housing struggles", "Document practical survival strategies"],
-        "financial-amends": ["Detail work history and financial recovery", "Include specific amends and responsibility steps"],
-        "help-world": ["Connect creative work to larger purpose", "Document how systems and tools help others"]
-    }
-    
-    recommendations.extend(purpose_specific.get(purpose, []))
+    recommendations.extend(PURPOSE_SPECIFIC_RECS.get(purpose, ()))
     
     return recommendations
 
-def calculate_avg_coherence(dimensional_coherence: dict) -> float:
-    """Calculate average 4D coherence across all folders"""
-    if not dimensional_coherence:
+def calculate_avg_coherence(coherence_scores: list) -> float:
+    """Calculate average 4D coherence across all folders (from unrounded folder scores)"""
+    if not coherence_scores:
         return 0.0
     
-    coherence_scores = [folder["4d_coherence_score"] for folder in dimensional_coherence.values()]
     return round(sum(coherence_scores) / len(coherence_scores), 3)
 
 def generate_4d_reorganization_recommendations(tesseract_analysis: dict) -> list:
     """Generate specific 4D reorganization recommendations"""
     recommendations = []
     
-    # Analyze coherence issues
-    low_coherence_folders = [
-        (folder_name, folder_data) for folder_name, folder_data in tesseract_analysis["dimensional_coherence"].items()
+    # Analyze coherence issues - keep only the first 10 names, count the rest
+    low_coherence_folders = (
+        folder_name for folder_name, folder_data in tesseract_analysis["dimensional_coherence"].items()
         if folder_data["4d_coherence_score"] < 0.5 and folder_data["file_count"] > 5
-    ]
+    )
+    affected_folders = list(islice(low_coherence_folders, 10))
+    low_coherence_count = len(affected_folders) + sum(1 for _ in low_coherence_folders)
     
-    if low_coherence_folders:
+    if low_coherence_count:
         recommendations.append({
             "type": "coherence_improvement",
             "priority": "high",
-            "description": f"Reorganize {len(low_coherence_folders)} folders with low 4D coherence",
-            "affected_folders": [folder[0] for folder in low_coherence_folders[:10]],
+            "description": f"Reorganize {low_coherence_count} folders with low 4D coherence",
+            "affected_folders": affected_folders,
             "impact": "Significantly improved findability and memoir structure"
         })
     
     # Analyze cluster opportunities
-    significant_clusters = [
-        cluster for cluster in tesseract_analysis["coordinate_clusters"].values()
+    significant_cluster_count = sum(
+        1 for cluster in tesseract_analysis["coordinate_clusters"].values()
         if len(cluster) > 10
-    ]
+    )
     
-    if significant_clusters:
+    if significant_cluster_count:
         recommendations.append({
             "type": "cluster_consolidation",
             "priority": "medium",
-            "description": f"Consolidate {len(significant_clusters)} major 4D clusters into coherent folders",
-            "cluster_count": len(significant_clusters),
+            "description": f"Consolidate {significant_cluster_count} major 4D clusters into coherent folders",
+            "cluster_count": significant_cluster_count,
             "impact": "Natural groupings based on Tesseract coordinates"
         })
     
@@ -3253,13 +3403,14 @@ async def suggest_tesseract_reorganization(
     
     # Get current 4D analysis
     try:
-        tesseract_structure_result = await analyze_tesseract_structure()
-        tesseract_map_result = await extract_tesseract_coordinates()
+        fingerprint = await _vault_fingerprint()
+        tesseract_structure_result = await _cached_tesseract_structure(fingerprint)
+        tesseract_map_result = await _cached_tesseract_coordinates(fingerprint)
         
         tesseract_structure = tesseract_structure_result["tesseract_structure_analysis"]
         tesseract_map = {
             "coordinate_combinations": tesseract_map_result["coordinate_combinations"],
-            "z_purpose_distribution": Counter(tesseract_map_result["dimensional_distributions"]["z_purpose"]),
+            "z_purpose_distribution": tesseract_map_result["dimensional_distributions"]["z_purpose"],
             "memoir_spine_candidates": tesseract_map_result["memoir_spine_analysis"]["high_priority_spine"]
         }
     except Exception as e:
@@ -3268,31 +3419,35 @@ async def suggest_tesseract_reorganization(
     suggestions = []
     
     # Primary suggestion: Organize by Purpose + Structure (Z + X dimensions)
+    # Groups hold file paths only; coordinates are looked up for groups that qualify
+    coordinate_combinations = tesseract_map["coordinate_combinations"]
+    if focus_purpose == "all":
+        focus_files = coordinate_combinations.items()
+    else:
+        # Only visit files with the requested purpose via the purpose index
+        focus_files = (
+            (file_path, coordinate_combinations[file_path])
+            for file_path in tesseract_purpose_index(tesseract_map_result).get(focus_purpose, ())
+        )
+    
     purpose_structure_groups = defaultdict(list)
-    for file_path, coords in tesseract_map["coordinate_combinations"].items():
-        if focus_purpose == "all" or coords["z_purpose"] == focus_purpose:
-            group_key = f"{coords['z_purpose']}/{coords['x_structure']}"
-            purpose_structure_groups[group_key].append({
-                "file": file_path,
-                "coordinates": coords
-            })
+    for file_path, coords in focus_files:
+        purpose_structure_groups[(coords["z_purpose"], coords["x_structure"])].append(file_path)
     
     # Generate suggestions for each significant group
-    for group_key, files in purpose_structure_groups.items():
+    for (purpose, structure), files in purpose_structure_groups.items():
         if len(files) >= consolidation_threshold:
-            purpose, structure = group_key.split('/')
-            
             suggestions.append({
                 "action": "create_tesseract_folder",
-                "group_key": group_key,
+                "group_key": f"{purpose}/{structure}",
                 "purpose": purpose,
                 "structure": structure,
                 "total_files": len(files),
                 "suggested_path": generate_tesseract_folder_path(purpose, structure),
                 "memoir_relevance": assess_memoir_relevance(purpose, structure),
                 "priority": calculate_tesseract_priority(purpose, structure, len(files), memoir_priority),
-                "4d_coherence": calculate_group_coherence(files),
-                "sample_files": [f["file"] for f in files[:5]]
+                "4d_coherence": calculate_group_coherence(files, coordinate_combinations),
+                "sample_files": files[:5]
             })
     
     # Special memoir spine suggestion
@@ -3333,29 +3488,50 @@ async def suggest_tesseract_reorganization(
         ]
     }
 
+# Purpose-based memoir relevance
+PURPOSE_RELEVANCE = {
+    "tell-story": "critical",
+    "help-addict": "high",
+    "prevent-death-poverty": "medium",
+    "financial-amends": "low",
+    "help-world": "medium"
+}
+
+# Structure-based memoir relevance
+STRUCTURE_RELEVANCE = {
+    "archetype": "high",  # Character development
+    "protocol": "medium", # Life systems
+    "shadowcast": "high", # Emotional depth
+    "expansion": "low",   # Background material
+    "summoning": "medium" # Pivotal moments
+}
+
+# Purpose-based reorganization priority
+PURPOSE_SCORES = {
+    "tell-story": 5,
+    "help-addict": 4,
+    "prevent-death-poverty": 3,
+    "financial-amends": 2,
+    "help-world": 3
+}
+
+# Structure-based reorganization priority
+STRUCTURE_SCORES = {
+    "archetype": 3,
+    "protocol": 2,
+    "shadowcast": 3,
+    "expansion": 1,
+    "summoning": 2
+}
+
+# Catch a renamed or added dimension value at import rather than as a silent default
+assert set(PURPOSE_RELEVANCE) == set(PURPOSE_SCORES) == set(PURPOSE_MEMOIR_WEIGHTS) == set(TESSERACT_PURPOSES)
+assert set(STRUCTURE_RELEVANCE) == set(STRUCTURE_SCORES) == set(TESSERACT_STRUCTURES)
+
 def assess_memoir_relevance(purpose: str, structure: str) -> str:
     """Assess memoir relevance based on Tesseract coordinates"""
-    
-    # Purpose-based memoir relevance
-    purpose_relevance = {
-        "tell-story": "critical",
-        "help-addict": "high",
-        "prevent-death-poverty": "medium",
-        "financial-amends": "low",
-        "help-world": "medium"
-    }
-    
-    # Structure-based memoir relevance
-    structure_relevance = {
-        "archetype": "high",  # Character development
-        "protocol": "medium", # Life systems
-        "shadowcast": "high", # Emotional depth
-        "expansion": "low",   # Background material
-        "summoning": "medium" # Pivotal moments
-    }
-    
-    base_relevance = purpose_relevance.get(purpose, "low")
-    structure_modifier = structure_relevance.get(structure, "medium")
+    base_relevance = PURPOSE_RELEVANCE.get(purpose, "low")
+    structure_modifier = STRUCTURE_RELEVANCE.get(structure, "medium")
     
     # Combine ratings
     if base_relevance == "critical":
@@ -3373,24 +3549,10 @@ def calculate_tesseract_priority(purpose: str, structure: str, file_count: int,
     base_score = 0
     
     # Purpose-based priority
-    purpose_scores = {
-        "tell-story": 5,
-        "help-addict": 4,
-        "prevent-death-poverty": 3,
-        "financial-amends": 2,
-        "help-world": 3
-    }
-    base_score += purpose_scores.get(purpose, 1)
+    base_score += PURPOSE_SCORES.get(purpose, 1)
     
     # Structure-based priority
-    structure_scores = {
-        "archetype": 3,
-        "protocol": 2,
-        "shadowcast": 3,
-        "expansion": 1,
-        "summoning": 2
-    }
-    base_score += structure_scores.get(structure, 1)
+    base_score += STRUCTURE_SCORES.get(structure, 1)
     
     # File count impact
     if file_count > 20:
@@ -3412,7 +3574,7 @@ def calculate_tesseract_priority(purpose: str, structure: str, file_count: int,
     else:
         return "low"
 
-def calculate_group_coherence(files: list) -> float:
+def calculate_group_coherence(files: list, coordinate_combinations: dict) -> float:
     """Calculate coherence for a group of files with same coordinates"""
     if not files:
         return 0.0
@@ -3420,8 +3582,8 @@ def calculate_group_coherence(files: list) -> float:
     # Files in same coordinate group should have high coherence by definition
     # But we can measure consistency in related metadata
     
-    coordinates_list = [f["coordinates"] for f in files]
-    return calculate_4d_coherence(coordinates_list)
+    coordinates_list = [coordinate_combinations[file_path] for file_path in files]
+    return round(calculate_4d_coherence(coordinates_list), 3)
 
 def identify_memoir_spine_structure(tesseract_map: dict) -> dict:
     """Identify the core memoir structure from Tesseract analysis"""
@@ -3453,90 +3615,90 @@ def identify_memoir_spine_structure(tesseract_map: dict) -> dict:
 
 def find_4d_orphans(tesseract_structure: dict) -> list:
     """Find files that are scattered across 4D space without clear groupings"""
-    orphans = []
-    
-    # Look for folders with very low coherence and high scatter
-    for folder_name, folder_data in tesseract_structure.get("dimensional_coherence", {}).items():
-        if (folder_data["4d_coherence_score"] < 0.3 and
-            folder_data.get("scatter_analysis", {}).get("scatter_score", 0) > 0.7):
-            orphans.append({
-                "folder": folder_name,
-                "file_count": folder_data["file_count"],
-                "coherence_issue": "high_scatter",
-                "scatter_score": folder_data.get("scatter_analysis", {}).get("scatter_score", 0)
-            })
-    
-    return orphans
+    # Folders with very low coherence and high scatter, flagged during the folder analysis pass
+    return tesseract_structure.get("4d_orphans", [])
+
+_TESSERACT_FOLDER_STRUCTURE = {
+    "memoir/": {
+        "description": "Tell My Story - Primary memoir content",
+        "subfolders": {
+            "spine/": "Core narrative backbone organized by cognitive terrain",
+            "personas/": "Archetype-based character studies and identity work",
+            "practices/": "Protocol-based recovery and life management routines",
+            "explorations/": "Shadowcast emotional fragments and mood pieces",
+            "context/": "Expansion background and supporting material"
+        }
+    },
+    "recovery/": {
+        "description": "Help Another Addict - AA and recovery focused content",
+        "subfolders": {
+            "practices/": "Step work, sponsor work, meeting protocols",
+            "personas/": "Recovery archetypes (sponsor, sponsee, group member)",
+            "explorations/": "Emotional recovery work, inventory, amends prep",
+            "activations/": "Summoning recovery energy, centering practices"
+        }
+    },
+    "survival/": {
+        "description": "Prevent Death/Poverty - Medical, housing, practical life",
+        "subfolders": {
+            "medical/": "Mayo clinic, health management, treatment protocols",
+            "housing/": "Sober house, homelessness preparation, practical survival",
+            "systems/": "Benefits, insurance, practical life management"
+        }
+    },
+    "work-amends/": {
+        "description": "Financial Amends - Employment, income, responsibility",
+        "subfolders": {
+            "job-search/": "Employment seeking, interviews, opportunities",
+            "skills/": "Technical abilities, creative work, professional development",
+            "planning/": "Financial recovery, debt management, future planning"
+        }
+    },
+    "contribution/": {
+        "description": "Help the World - Creative work, systems, tools",
+        "subfolders": {
+            "creative/": "AI art, music, comedy, creative expression",
+            "systems/": "Technical tools, APIs, helpful systems",
+            "philosophy/": "Wisdom, insights, contributions to understanding"
+        }
+    },
+    "_tesseract-meta/": {
+        "description": "Tesseract system files and coordinate mappings",
+        "subfolders": {
+            "coordinates/": "4D mapping files and analysis",
+            "inbox/": "New content awaiting coordinate assignment",
+            "templates/": "Tesseract-aware document templates"
+        }
+    }
+}
 
 def generate_tesseract_folder_structure() -> dict:
     """Generate complete Tesseract-native folder structure for Rick's codex"""
-    return {
-        "memoir/": {
-            "description": "Tell My Story - Primary memoir content",
-            "subfolders": {
-                "spine/": "Core narrative backbone organized by cognitive terrain",
-                "personas/": "Archetype-based character studies and identity work",
-                "practices/": "Protocol-based recovery and life management routines",
-                "explorations/": "Shadowcast emotional fragments and mood pieces",
-                "context/": "Expansion background and supporting material"
-            }
-        },
-        "recovery/": {
-            "description": "Help Another Addict - AA and recovery focused content",
-            "subfolders": {
-                "practices/": "Step work, sponsor work, meeting protocols",
-                "personas/": "Recovery archetypes (sponsor, sponsee, group member)",
-                "explorations/": "Emotional recovery work, inventory, amends prep",
-                "activations/": "Summoning recovery energy, centering practices"
-            }
-        },
-        "survival/": {
-            "description": "Prevent Death/Poverty - Medical, housing, practical life",
-            "subfolders": {
-                "medical/": "Mayo clinic, health management, treatment protocols",
-                "housing/": "Sober house, homelessness preparation, practical survival",
-                "systems/": "Benefits, insurance, practical life management"
-            }
-        },
-        "work-amends/": {
-            "description": "Financial Amends - Employment, income, responsibility",
-            "subfolders": {
-                "job-search/": "Employment seeking, interviews, opportunities",
-                "skills/": "Technical abilities, creative work, professional development",
-                "planning/": "Financial recovery, debt management, future planning"
-            }
-        },
-        "contribution/": {
-            "description": "Help the World - Creative work, systems, tools",
-            "subfolders": {
-                "creative/": "AI art, music, comedy, creative expression",
-                "systems/": "Technical tools, APIs, helpful systems",
-                "philosophy/": "Wisdom, insights, contributions to understanding"
-            }
-        },
-        "_tesseract-meta/": {
-            "description": "Tesseract system files and coordinate mappings",
-            "subfolders": {
-                "coordinates/": "4D mapping files and analysis",
-                "inbox/": "New content awaiting coordinate assignment",
-                "templates/": "Tesseract-aware document templates"
-            }
-        }
-    }
+    # Static layout shared across requests - callers must not mutate it
+    return _TESSERACT_FOLDER_STRUCTURE
 
 @router.get("/api/tesseract/memoir-readiness")
 async def assess_tesseract_memoir_readiness():
     """Comprehensive memoir readiness assessment using 4D Tesseract analysis"""
+    # Scores, percentages and rounding are derived once per vault state, not per request; the same
+    # fingerprint keys the analyses underneath, so an outside edit refreshes all of them together
+    fingerprint = await _vault_fingerprint()
+    return await _cached_tesseract_analysis(
+        "memoir_readiness", lambda: compute_tesseract_memoir_readiness(fingerprint), fingerprint
+    )
+
+async def compute_tesseract_memoir_readiness(fingerprint: int = None):
+    """Build the memoir readiness assessment from the cached 4D analyses"""
     
     try:
-        tesseract_map_result = await extract_tesseract_coordinates()
-        tesseract_structure_result = await analyze_tesseract_structure()
+        tesseract_map_result = await _cached_tesseract_coordinates(fingerprint)
+        tesseract_structure_result = await _cached_tesseract_structure(fingerprint)
         
         tesseract_map = {
             "coordinate_combinations": tesseract_map_result["coordinate_combinations"],
-            "x_structure_distribution": Counter(tesseract_map_result["dimensional_distributions"]["x_structure"]),
-            "y_transmission_distribution": Counter(tesseract_map_result["dimensional_distributions"]["y_transmission"]),
-            "w_terrain_distribution": Counter(tesseract_map_result["dimensional_distributions"]["w_terrain"]),
+            "x_structure_distribution": tesseract_map_result["dimensional_distributions"]["x_structure"],
+            "y_transmission_distribution": tesseract_map_result["dimensional_distributions"]["y_transmission"],
+            "w_terrain_distribution": tesseract_map_result["dimensional_distributions"]["w_terrain"],
             "memoir_spine_candidates": tesseract_map_result["memoir_spine_analysis"]["high_priority_spine"]
         }
         
@@ -3555,52 +3717,61 @@ async def assess_tesseract_memoir_readiness():
         "production_recommendations": []
     }
     
+    # Every mapped file has exactly one value per dimension, so this is each distribution's total
+    total_content = len(tesseract_map["coordinate_combinations"])
+    
     # X-Dimension Analysis: Structure readiness
     structure_dist = tesseract_map["x_structure_distribution"]
+    structure_score = calculate_structure_memoir_readiness(structure_dist, total_content)
     memoir_analysis["dimensional_scores"]["x_structure"] = {
         "archetype_content": structure_dist.get("archetype", 0),
         "protocol_systems": structure_dist.get("protocol", 0),
         "shadowcast_depth": structure_dist.get("shadowcast", 0),
-        "narrative_readiness": calculate_structure_memoir_readiness(structure_dist)
+        "narrative_readiness": round(structure_score, 3)
     }
     
     # Y-Dimension Analysis: Transmission readiness
     transmission_dist = tesseract_map["y_transmission_distribution"]
+    transmission_score = calculate_transmission_memoir_readiness(transmission_dist, total_content)
     memoir_analysis["dimensional_scores"]["y_transmission"] = {
         "narrative_content": transmission_dist.get("narrative", 0),
-        "total_content": sum(transmission_dist.values()),
-        "narrative_percentage": transmission_dist.get("narrative", 0) / max(sum(transmission_dist.values()), 1) * 100,
-        "transmission_readiness": calculate_transmission_memoir_readiness(transmission_dist)
+        "total_content": total_content,
+        "narrative_percentage": transmission_dist.get("narrative", 0) / max(total_content, 1) * 100,
+        "transmission_readiness": round(transmission_score, 3)
     }
     
     # Z-Dimension Analysis: Purpose coverage (Rick's 5 core intents)
     purpose_coverage = tesseract_structure.get("memoir_readiness_by_purpose", {})
     memoir_analysis["purpose_coverage"] = purpose_coverage
     
-    # Calculate overall purpose readiness
-    purpose_scores = [data.get("memoir_readiness", {}).get("readiness_score", 0) for data in purpose_coverage.values()]
+    # Calculate overall purpose readiness - recomputed unrounded from each purpose's counts, since
+    # the readiness_score shown per purpose is rounded for display
+    purpose_scores = [
+        calculate_purpose_readiness_scores(
+            purpose, data["narrative_files"], data["total_files"], len(data["cognitive_terrains"])
+        )[0]
+        for purpose, data in purpose_coverage.items()
+    ]
     avg_purpose_readiness = sum(purpose_scores) / len(purpose_scores) if purpose_scores else 0
     
     # W-Dimension Analysis: Cognitive terrain balance
     terrain_dist = tesseract_map["w_terrain_distribution"]
+    terrain_score = calculate_terrain_memoir_readiness(terrain_dist, total_content)
     memoir_analysis["cognitive_terrain_balance"] = {
         "terrain_distribution": dict(terrain_dist),
         "emotional_range": len(terrain_dist),  # More terrains = richer emotional content
         "chaos_integration": terrain_dist.get("chaotic", 0),  # Important for trauma memoir
         "complexity_depth": terrain_dist.get("complex", 0),   # Shows thoughtful processing
-        "terrain_readiness": calculate_terrain_memoir_readiness(terrain_dist)
+        "terrain_readiness": round(terrain_score, 3)
     }
     
     # Narrative spine analysis
     spine_candidates = tesseract_map["memoir_spine_candidates"]
-    spine_strength = len([c for c in spine_candidates if c.get("memoir_priority", 0) > 0.6])
+    spine_strength = sum(1 for c in spine_candidates if c.get("memoir_priority", 0) > 0.6)
     memoir_analysis["narrative_spine_strength"] = spine_strength / max(len(spine_candidates), 1) if spine_candidates else 0
     
-    # Calculate overall 4D readiness
-    structure_score = memoir_analysis["dimensional_scores"]["x_structure"]["narrative_readiness"]
-    transmission_score = memoir_analysis["dimensional_scores"]["y_transmission"]["transmission_readiness"]
+    # Calculate overall 4D readiness (from the unrounded dimension scores)
     purpose_score = avg_purpose_readiness
-    terrain_score = memoir_analysis["cognitive_terrain_balance"]["terrain_readiness"]
     spine_score = memoir_analysis["narrative_spine_strength"]
     
     # Weighted overall score (purpose and spine most important)
@@ -3624,72 +3795,72 @@ async def assess_tesseract_memoir_readiness():
         ]
     }
 
-def calculate_structure_memoir_readiness(structure_dist: Counter) -> float:
+def weighted_distribution_score(distribution: dict, weights: dict, total: int, default_weight: float) -> float:
+    """Weighted share of a dimension distribution: sum(count / total * weight)"""
+    return sum(count * weights.get(value, default_weight) for value, count in distribution.items()) / total
+
+# Weight different structures for memoir value
+STRUCTURE_MEMOIR_WEIGHTS = {
+    "archetype": 0.3,  # High value for character development
+    "protocol": 0.2,  # Medium value for life systems
+    "shadowcast": 0.3, # High value for emotional depth
+    "expansion": 0.1,  # Lower value for background material
+    "summoning": 0.25  # Good value for pivotal moments
+}
+
+def calculate_structure_memoir_readiness(structure_dist: dict, total_structures: int = None) -> float:
     """Calculate memoir readiness based on X-dimension structure distribution"""
-    total_structures = sum(structure_dist.values())
+    if total_structures is None:
+        total_structures = sum(structure_dist.values())
     if total_structures == 0:
         return 0.0
     
-    # Weight different structures for memoir value
-    structure_weights = {
-        "archetype": 0.3,  # High value for character development
-        "protocol": 0.2,  # Medium value for life systems
-        "shadowcast": 0.3, # High value for emotional depth
-        "expansion": 0.1,  # Lower value for background material
-        "summoning": 0.25  # Good value for pivotal moments
-    }
-    
-    weighted_score = 0.0
-    for structure, count in structure_dist.items():
-        weight = structure_weights.get(structure, 0.15)
-        weighted_score += (count / total_structures) * weight
+    weighted_score = weighted_distribution_score(structure_dist, STRUCTURE_MEMOIR_WEIGHTS, total_structures, 0.15)
     
-    return round(weighted_score, 3)
+    return weighted_score
+
+# Narrative content is most important for memoir; plain text gives supporting value
+TRANSMISSION_MEMOIR_WEIGHTS = {
+    "narrative": 0.8,
+    "text": 0.2
+}
 
-def calculate_transmission_memoir_readiness(transmission_dist: Counter) -> float:
+def calculate_transmission_memoir_readiness(transmission_dist: dict, total_transmissions: int = None) -> float:
     """Calculate memoir readiness based on Y-dimension transmission distribution"""
-    total_transmissions = sum(transmission_dist.values())
+    if total_transmissions is None:
+        total_transmissions = sum(transmission_dist.values())
     if total_transmissions == 0:
         return 0.0
     
-    # Narrative content is most important for memoir
-    narrative_ratio = transmission_dist.get("narrative", 0) / total_transmissions
-    
-    # Other transmission modes provide supporting value
-    text_ratio = transmission_dist.get("text", 0) / total_transmissions
-    
-    # Calculate readiness (narrative most important)
-    readiness = (narrative_ratio * 0.8) + (text_ratio * 0.2)
+    readiness = weighted_distribution_score(transmission_dist, TRANSMISSION_MEMOIR_WEIGHTS, total_transmissions, 0.0)
     
-    return round(readiness, 3)
+    return readiness
 
-def calculate_terrain_memoir_readiness(terrain_dist: Counter) -> float:
+# Some terrains are more valuable for memoir
+TERRAIN_MEMOIR_WEIGHTS = {
+    "chaotic": 0.25,    # Essential for trauma memoir authenticity
+    "complex": 0.3,     # Shows depth and processing
+    "complicated": 0.2, # Good for technical/system content
+    "confused": 0.15,   # Authentic but needs balance
+    "obvious": 0.1      # Simple content, less memoir value
+}
+
+def calculate_terrain_memoir_readiness(terrain_dist: dict, total_terrain: int = None) -> float:
     """Calculate memoir readiness based on W-dimension cognitive terrain balance"""
-    total_terrain = sum(terrain_dist.values())
+    if total_terrain is None:
+        total_terrain = sum(terrain_dist.values())
     if total_terrain == 0:
         return 0.0
     
     # Memoir benefits from emotional range across terrains
     terrain_diversity = len(terrain_dist) / 5  # Max 5 terrain types
     
-    # Some terrains are more valuable for memoir
-    terrain_weights = {
-        "chaotic": 0.25,    # Essential for trauma memoir authenticity
-        "complex": 0.3,     # Shows depth and processing
-        "complicated": 0.2, # Good for technical/system content
-        "confused": 0.15,   # Authentic but needs balance
-        "obvious": 0.1      # Simple content, less memoir value
-    }
-    
-    weighted_score = 0.0
-    for terrain, count in terrain_dist.items():
-        weight = terrain_weights.get(terrain, 0.15)
-        weighted_score += (count / total_terrain) * weight
+    weighted_score = weighted_distribution_score(terrain_dist, TERRAIN_MEMOIR_WEIGHTS, total_terrain, 0.15)
     
     # Combine weighted content with diversity bonus
     readiness = (weighted_score * 0.7) + (terrain_diversity * 0.3)
     
-    return round(readiness, 3)
+    return readiness
 
 def categorize_memoir_readiness(overall_score: float) -> dict:
     """Categorize memoir readiness with specific guidance"""
@@ -3763,21 +3934,50 @@ from app.utils import (
     identify_document_archetype, extract_content_signature, count_internal_references,
     analyze_folder_content_types, measure_tag_coherence, extract_naming_patterns,
     calculate_urgency_score, group_by_archetype, generate_folder_path,
-    calculate_priority, find_orphaned_files, chunked
+    calculate_priority, find_orphaned_files, chunked,
+    analyze_markdown_document, DOCUMENT_CACHE, VaultScan, scan_vault
 )
 
 # ============================================================================
 # NEW: PHASE 2 CONTENT INTELLIGENCE ENDPOINTS
 # ============================================================================
 
+# Worker processes for fingerprinting new or modified documents - started on first use and
+# kept for the life of the app, so each request doesn't pay for spawning and tearing down workers
+_document_pool = None
+_document_pool_lock = threading.Lock()
+
+def get_document_pool() -> ProcessPoolExecutor:
+    """Shared process pool for document analysis, created lazily"""
+    global _document_pool
+    with _document_pool_lock:
+        if _document_pool is None:
+            _document_pool = ProcessPoolExecutor()
+        return _document_pool
+
+def shutdown_document_pool():
+    """Stop the document analysis workers (app shutdown, or after a worker crashed)"""
+    global _document_pool
+    with _document_pool_lock:
+        pool, _document_pool = _document_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+router.add_event_handler("shutdown", shutdown_document_pool)
+
 @router.post("/api/analysis/content-fingerprint")
 async def analyze_content_patterns():
     """Create content fingerprints to understand document types and patterns"""
+    return await compute_content_patterns(await asyncio.to_thread(scan_vault, VAULT_PATH))
+
+async def compute_content_patterns(scan: VaultScan) -> dict:
+    """Content fingerprints for the markdown files of a vault scan"""
     patterns = {
         "document_types": Counter(),
         "content_signatures": {},
         "structural_patterns": {},
         "cross_reference_density": {},
+        "archetypes": {},
         "narrative_markers": Counter()
     }
     
@@ -3785,43 +3985,83 @@ async def analyze_content_patterns():
     error_files = 0
     
     # Sample analysis for initial understanding (process all files but track progress)
-    for md_file in VAULT_PATH.rglob("*.md"):
-        try:
-            content = md_file.read_text(encoding="utf-8")
-            file_path_str = str(md_file.relative_to(VAULT_PATH))
-            
-            # Identify document archetypes
-            archetype = identify_document_archetype(content)
-            patterns["document_types"][archetype] += 1
-            
-            # Extract structural signatures
-            signature = extract_content_signature(content)
-            patterns["content_signatures"][file_path_str] = signature
-            
-            # Measure cross-reference density
-            ref_density = count_internal_references(content)
-            patterns["cross_reference_density"][file_path_str] = ref_density
-            
-            processed_files += 1
-            
-            # Progress tracking for large vaults
-            if processed_files % 100 == 0:
-                print(f"Processed {processed_files} files...")
-                
-        except Exception as e:
+    md_files = scan.md_files
+    
+    # Unchanged files come from the persisted document cache; only new or modified ones are
+    # fingerprinted, spread over worker processes off the event loop (chunksize amortizes the IPC)
+    def scan_documents():
+        results = [None] * len(md_files)
+        pending = []
+        live_keys = set()
+        for index, (md_file, stat) in enumerate(zip(md_files, scan.md_stats)):
+            if stat is None:
+                pending.append((index, None, None))
+                continue
+            file_key = str(md_file.relative_to(VAULT_PATH))
+            live_keys.add(file_key)
+            cached = DOCUMENT_CACHE.lookup(file_key, stat.st_mtime_ns, stat.st_size)
+            if cached is not None:
+                results[index] = (None, cached)
+            else:
+                pending.append((index, file_key, stat))
+        
+        if pending:
+            try:
+                scanned = get_document_pool().map(
+                    analyze_markdown_document,
+                    [str(md_files[index]) for index, _, _ in pending],
+                    chunksize=64
+                )
+                for (index, file_key, stat), (error, analysis) in zip(pending, scanned):
+                    results[index] = (error, analysis)
+                    if error is None and file_key is not None:
+                        DOCUMENT_CACHE.store(file_key, stat.st_mtime_ns, stat.st_size, analysis)
+            except BrokenProcessPool:
+                # A dead worker breaks the whole pool; start a fresh one on the next request
+                shutdown_document_pool()
+                raise
+        
+        DOCUMENT_CACHE.retain(live_keys)
+        DOCUMENT_CACHE.save()
+        return results
+    
+    document_results = await asyncio.to_thread(scan_documents)
+    
+    for md_file, (error, analysis) in zip(md_files, document_results):
+        if error is not None:
             error_files += 1
-            print(f"Error processing {md_file}: {e}")
+            print(f"Error processing {md_file}: {error}")
+            continue
+        
+        archetype, signature = analysis
+        file_path_str = str(md_file.relative_to(VAULT_PATH))
+        
+        # Identify document archetypes (kept per path so nothing below re-reads the file)
+        patterns["document_types"][archetype] += 1
+        patterns["archetypes"][file_path_str] = archetype
+        
+        # Extract structural signatures
+        patterns["content_signatures"][file_path_str] = signature
+        
+        # Measure cross-reference density (the signature already counted them)
+        patterns["cross_reference_density"][file_path_str] = signature["cross_reference_count"]
+        
+        processed_files += 1
+        
+        # Progress tracking for large vaults
+        if processed_files % PROGRESS_PRINT_INTERVAL == 0:
+            print(f"Processed {processed_files} files...")
     
     # Calculate aggregate metrics
     total_words = sum(sig.get("word_count", 0) for sig in patterns["content_signatures"].values())
     avg_cross_refs = sum(patterns["cross_reference_density"].values()) / len(patterns["cross_reference_density"]) if patterns["cross_reference_density"] else 0
     
     # Identify most connected documents (high cross-reference density)
-    top_connected = sorted(
+    top_connected = heapq.nlargest(
+        20,
         patterns["cross_reference_density"].items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:20]
+        key=lambda x: x[1]
+    )
     
     return {
         "analysis_summary": {
@@ -3843,57 +4083,85 @@ async def analyze_content_patterns():
                    sig.get("personal_pronouns", {}).get("first_person", 0) > 10
             ][:20],
             "recovery_focus": [
-                path for path in patterns["content_signatures"].keys()
-                if identify_document_archetype(
-                    VAULT_PATH.joinpath(path).read_text(encoding="utf-8")
-                ) == "recovery-document"
+                path for path, archetype in patterns["archetypes"].items()
+                if archetype == "recovery-document"
             ][:20]
         },
         "structural_insights": {
             "files_with_yaml": sum(1 for sig in patterns["content_signatures"].values() if sig.get("has_yaml", False)),
             "files_with_code": sum(1 for sig in patterns["content_signatures"].values() if sig.get("has_code_blocks", False)),
-            "highly_linked_content": len([d for d in patterns["cross_reference_density"].values() if d > 5])
+            "highly_linked_content": sum(1 for d in patterns["cross_reference_density"].values() if d > 5)
         }
     }
 
+def analyze_folder_contents(folder_path: Path, md_files: list) -> Optional[dict]:
+    """Analyze one folder's markdown files (None when the folder can't be analyzed)"""
+    try:
+        # Analyze folder contents
+        content_types = analyze_folder_content_types(md_files)
+        tag_coherence = measure_tag_coherence(md_files)
+        naming_patterns = extract_naming_patterns(md_files)
+        
+        return {
+            "file_count": len(md_files),
+            "content_types": content_types,
+            "tag_coherence_score": round(tag_coherence, 3),
+            "naming_patterns": naming_patterns,
+            "reorganization_urgency": round(
+                calculate_urgency_score(content_types, tag_coherence), 3
+            ),
+            "path_depth": len(folder_path.relative_to(VAULT_PATH).parts)
+        }
+    except Exception as e:
+        print(f"Error analyzing folder {folder_path}: {e}")
+        return None
+
 @router.get("/api/analysis/folder-chaos")
 async def analyze_folder_structure():
     """Analyze current folder structure for reorganization opportunities"""
+    return await compute_folder_structure(await asyncio.to_thread(scan_vault, VAULT_PATH))
+
+async def compute_folder_structure(scan: VaultScan) -> dict:
+    """Folder-level reorganization analysis for the folders of a vault scan"""
     folder_analysis = {}
     processed_folders = 0
     
-    for folder_path in VAULT_PATH.rglob("*"):
-        if folder_path.is_dir() and not folder_path.name.startswith('.'):
-            md_files = list(folder_path.glob("*.md"))
-            if md_files:
-                try:
-                    # Analyze folder contents
-                    content_types = analyze_folder_content_types(md_files)
-                    tag_coherence = measure_tag_coherence(md_files)
-                    naming_patterns = extract_naming_patterns(md_files)
-                    
-                    folder_key = str(folder_path.relative_to(VAULT_PATH))
-                    folder_analysis[folder_key] = {
-                        "file_count": len(md_files),
-                        "content_types": content_types,
-                        "tag_coherence_score": round(tag_coherence, 3),
-                        "naming_patterns": naming_patterns,
-                        "reorganization_urgency": round(
-                            calculate_urgency_score(content_types, tag_coherence), 3
-                        ),
-                        "path_depth": len(folder_path.relative_to(VAULT_PATH).parts)
-                    }
-                    processed_folders += 1
-                    
-                except Exception as e:
-                    print(f"Error analyzing folder {folder_path}: {e}")
+    # Folders in rglob("*") order, each with the markdown files the scan found in it
+    folders = []
+    for folder in scan.folder_order:
+        folder_path = Path(folder)
+        md_files = scan.md_files_by_folder.get(folder)
+        if md_files and not folder_path.name.startswith('.'):
+            folders.append((folder_path, md_files))
+    
+    # Folders are independent and mostly file reads - fan out over a thread pool (map keeps walk order)
+    with ThreadPoolExecutor() as executor:
+        analyses = executor.map(lambda folder: analyze_folder_contents(*folder), folders)
+        for (folder_path, _), analysis in zip(folders, analyses):
+            if analysis is not None:
+                folder_analysis[str(folder_path.relative_to(VAULT_PATH))] = analysis
+                processed_folders += 1
     
-    # Sort by urgency and identify chaos hotspots
-    chaos_hotspots = sorted(
+    # Identify chaos hotspots - top 20 by urgency (nlargest keeps sorted()'s tie order)
+    chaos_hotspots = heapq.nlargest(
+        20,
         folder_analysis.items(),
-        key=lambda x: x[1]["reorganization_urgency"],
-        reverse=True
-    )[:20]
+        key=lambda x: x[1]["reorganization_urgency"]
+    )
+    
+    # Structural issues and the file total in one pass
+    total_files = 0
+    deep_nested_folders = []
+    singleton_folders = []
+    mixed_content_folders = []
+    for folder, analysis in folder_analysis.items():
+        total_files += analysis["file_count"]
+        if analysis["path_depth"] > 4:
+            deep_nested_folders.append(folder)
+        if analysis["file_count"] == 1:
+            singleton_folders.append(folder)
+        if analysis["content_types"]["type_diversity"] > 0.7:
+            mixed_content_folders.append(folder)
     
     # Generate structure suggestions
     structure_suggestions = generate_structure_suggestions(folder_analysis)
@@ -3902,22 +4170,13 @@ async def analyze_folder_structure():
         "analysis_summary": {
             "total_folders_analyzed": processed_folders,
             "folders_with_files": len(folder_analysis),
-            "avg_files_per_folder": sum(f["file_count"] for f in folder_analysis.values()) / len(folder_analysis) if folder_analysis else 0
+            "avg_files_per_folder": total_files / len(folder_analysis) if folder_analysis else 0
         },
         "chaos_hotspots": chaos_hotspots,
         "structural_issues": {
-            "deep_nested_folders": [
-                folder for folder, analysis in folder_analysis.items()
-                if analysis["path_depth"] > 4
-            ],
-            "singleton_folders": [
-                folder for folder, analysis in folder_analysis.items()
-                if analysis["file_count"] == 1
-            ][:10],
-            "mixed_content_folders": [
-                folder for folder, analysis in folder_analysis.items()
-                if analysis["content_types"]["type_diversity"] > 0.7
-            ][:10]
+            "deep_nested_folders": deep_nested_folders,
+            "singleton_folders": singleton_folders[:10],
+            "mixed_content_folders": mixed_content_folders[:10]
         },
         "suggested_structure": structure_suggestions,
         "reorganization_impact": calculate_reorganization_impact(folder_analysis)
@@ -3996,6 +4255,14 @@ def calculate_reorganization_impact(folder_analysis: dict) -> dict:
         "reorganization_complexity": "high" if total_files > 500 else "medium" if total_files > 100 else "low"
     }
 
+REORGANIZATION_FOCUS_ARCHETYPES = {
+    "memoir": ["memoir-narrative"],
+    "recovery": ["recovery-document"],
+    "creative": ["creative-work"],
+    "medical": ["medical-health"],
+    "technical": ["technical-system"]
+}
+
 @router.post("/api/reorganize/suggest")
 async def suggest_reorganization(
     focus_area: str = "all",  # memoir, recovery, creative, medical, technical, all
@@ -4004,9 +4271,10 @@ async def suggest_reorganization(
 ):
     """Generate intelligent folder reorganization suggestions"""
     
-    # Get current analysis
-    content_analysis = await analyze_content_patterns()
-    folder_analysis = await analyze_folder_structure()
+    # Get current analysis (cached until the vault changes) - one vault walk feeds both
+    scan = await asyncio.to_thread(scan_vault, VAULT_PATH)
+    content_analysis = await _cached_vault_analysis("content_patterns", compute_content_patterns, scan)
+    folder_analysis = await _cached_vault_analysis("folder_structure", compute_folder_structure, scan)
     
     suggestions = []
     
@@ -4015,32 +4283,35 @@ async def suggest_reorganization(
     
     # Filter by focus area if specified
     if focus_area != "all":
-        focus_mappings = {
-            "memoir": ["memoir-narrative"],
-            "recovery": ["recovery-document"],
-            "creative": ["creative-work"],
-            "medical": ["medical-health"],
-            "technical": ["technical-system"]
-        }
-        target_types = focus_mappings.get(focus_area, [focus_area])
+        target_types = REORGANIZATION_FOCUS_ARCHETYPES.get(focus_area, [focus_area])
     else:
         target_types = list(document_types.keys())
     
+    # One pass over the hotspots: index them by dominant archetype and collect deep, sparse folders
+    hotspots_by_type = defaultdict(list)
+    orphaned_files = []
+    for folder_path, folder_data in folder_analysis["chaos_hotspots"]:
+        hotspots_by_type[folder_data["content_types"]["dominant_type"]].append({
+            "folder": folder_path,
+            "file_count": folder_data["file_count"],
+            "urgency": folder_data["reorganization_urgency"]
+        })
+        if (folder_data["path_depth"] > 4 and
+            folder_data["file_count"] < 3):
+            orphaned_files.append({
+                "current_path": folder_path,
+                "file_count": folder_data["file_count"],
+                "suggested_target": "_inbox/needs-review",
+                "reason": "deeply_nested_singleton"
+            })
+    
     # Generate consolidation suggestions for each archetype
     for archetype in target_types:
         file_count = document_types.get(archetype, 0)
         if file_count >= consolidation_threshold:
             
-            # Find current folders containing this archetype
-            current_locations = []
-            for folder_path, folder_data in folder_analysis["chaos_hotspots"]:
-                dominant_type = folder_data["content_types"]["dominant_type"]
-                if dominant_type == archetype:
-                    current_locations.append({
-                        "folder": folder_path,
-                        "file_count": folder_data["file_count"],
-                        "urgency": folder_data["reorganization_urgency"]
-                    })
+            # Current folders dominated by this archetype
+            current_locations = hotspots_by_type.get(archetype, [])
             
             suggestions.append({
                 "action": "consolidate_by_archetype",
@@ -4054,18 +4325,7 @@ async def suggest_reorganization(
                 "memoir_relevance": get_memoir_relevance(archetype)
             })
     
-    # Identify orphaned and deeply nested files
-    orphaned_files = []
-    for folder_path, folder_data in folder_analysis["chaos_hotspots"]:
-        if (folder_data["path_depth"] > 4 and
-            folder_data["file_count"] < 3):
-            orphaned_files.extend([{
-                "current_path": folder_path,
-                "file_count": folder_data["file_count"],
-                "suggested_target": "_inbox/needs-review",
-                "reason": "deeply_nested_singleton"
-            }])
-    
+    # Orphaned and deeply nested files (collected in the hotspot pass above)
     if orphaned_files:
         suggestions.append({
             "action": "rescue_orphaned_files",
@@ -4087,7 +4347,7 @@ async def suggest_reorganization(
     return {
         "focus_area": focus_area,
         "total_suggestions": len(suggestions),
-        "high_priority_count": len([s for s in suggestions if s.get("priority") == "high"]),
+        "high_priority_count": sum(1 for s in suggestions if s.get("priority") == "high"),
         "suggestions": suggestions,
         "estimated_total_impact": calculate_suggestion_impact(suggestions),
         "next_steps": [
@@ -4098,18 +4358,19 @@ async def suggest_reorganization(
         ]
     }
 
+MEMOIR_RELEVANCE = {
+    "memoir-narrative": "critical - primary memoir content",
+    "recovery-document": "critical - central to your story",
+    "medical-health": "high - important life context",
+    "practical-life": "medium - daily life details",
+    "philosophical-reflection": "medium - provides depth and insight",
+    "creative-work": "low - supplementary creative expression",
+    "technical-system": "low - behind-the-scenes infrastructure"
+}
+
 def get_memoir_relevance(archetype: str) -> str:
     """Assess how relevant an archetype is to memoir writing"""
-    memoir_relevance = {
-        "memoir-narrative": "critical - primary memoir content",
-        "recovery-document": "critical - central to your story",
-        "medical-health": "high - important life context",
-        "practical-life": "medium - daily life details",
-        "philosophical-reflection": "medium - provides depth and insight",
-        "creative-work": "low - supplementary creative expression",
-        "technical-system": "low - behind-the-scenes infrastructure"
-    }
-    return memoir_relevance.get(archetype, "unknown")
+    return MEMOIR_RELEVANCE.get(archetype, "unknown")
 
 def generate_memoir_structure_suggestions(content_analysis: dict) -> list:
     """Generate specific suggestions for memoir organization"""
@@ -4144,7 +4405,7 @@ def generate_memoir_structure_suggestions(content_analysis: dict) -> list:
 def calculate_suggestion_impact(suggestions: list) -> dict:
     """Calculate estimated impact of implementing suggestions"""
     total_files = sum(s.get("total_files", 0) for s in suggestions)
-    high_priority = len([s for s in suggestions if s.get("priority") == "high"])
+    high_priority = sum(1 for s in suggestions if s.get("priority") == "high")
     
     # Estimate time savings
     search_time_savings = sum(
@@ -4159,6 +4420,47 @@ def calculate_suggestion_impact(suggestions: list) -> dict:
         "memoir_production_readiness": "significantly improved" if high_priority > 2 else "moderately improved"
     }
 
+# Upper bound on concurrent file moves per batch (keeps file descriptors and threads in check)
+REORGANIZATION_MOVE_CONCURRENCY = 32
+
+def execute_reorganization_move(move: dict, dry_run: bool) -> dict:
+    """Check one planned move and, unless dry_run, perform it - blocking, runs in a worker thread"""
+    source_path = VAULT_PATH / move["source"]
+    target_dir = VAULT_PATH / move["target"]
+    source_missing = {
+        "file": move["source"],
+        "status": "error",
+        "error": "Source file not found"
+    }
+    
+    if not dry_run:
+        # Move file - try the rename straight away; the rename itself reports a missing source,
+        # and the target directory only needs creating the first time it fails for that reason
+        target_path = target_dir / source_path.name
+        try:
+            os.replace(source_path, target_path)
+        except FileNotFoundError:
+            if not source_path.exists():
+                return source_missing
+            target_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(source_path, target_path)
+        status = "moved"
+    elif source_path.exists():
+        status = "planned"
+    else:
+        return source_missing
+    
+    return {
+        "file": move["source"],
+        "target": move["target"],
+        "archetype": move.get("archetype", "unknown"),
+        "status": status
+    }
+
+async def _run_reorganization_move(move: dict, dry_run: bool, move_slots: asyncio.Semaphore) -> dict:
+    async with move_slots:
+        return await asyncio.to_thread(execute_reorganization_move, move, dry_run)
+
 @router.post("/api/reorganize/execute")
 async def execute_reorganization(
     suggestion_id: int,  # Which suggestion to execute
@@ -4189,61 +4491,51 @@ async def execute_reorganization(
         {"source": "scattered/file2.md", "target": "recovery/documents/", "archetype": "recovery-document"}
     ]
     
+    move_slots = asyncio.Semaphore(REORGANIZATION_MOVE_CONCURRENCY)
+    
+    # Batch count once up front - both the inter-batch pause and the summary need it
+    total_batches = (len(example_moves) + batch_size - 1) // batch_size if batch_size > 0 else 0
+    
     try:
         for batch_num, batch in enumerate(chunked(example_moves, batch_size), 1):
             batch_results = []
             
             print(f"Processing batch {batch_num} ({len(batch)} files)...")
             
-            for move in batch:
-                try:
-                    source_path = VAULT_PATH / move["source"]
-                    target_dir = VAULT_PATH / move["target"]
-                    
-                    if not source_path.exists():
-                        batch_results.append({
-                            "file": move["source"],
-                            "status": "error",
-                            "error": "Source file not found"
-                        })
-                        continue
-                    
-                    if not dry_run:
-                        # Create target directory
-                        target_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        # Move file
-                        target_path = target_dir / source_path.name
-                        source_path.rename(target_path)
-                        
-                        status = "moved"
-                        successful_moves += 1
-                    else:
-                        status = "planned"
-                    
-                    batch_results.append({
-                        "file": move["source"],
-                        "target": move["target"],
-                        "archetype": move.get("archetype", "unknown"),
-                        "status": status
-                    })
-                    
-                    total_moves += 1
-                    
-                except Exception as e:
-                    error_msg = str(e)
+            # Moves within a batch are independent filesystem calls - run them on threads, bounded
+            # by the semaphore; gather keeps plan order
+            moves_before_batch = successful_moves
+            outcomes = await asyncio.gather(
+                *(_run_reorganization_move(move, dry_run, move_slots) for move in batch),
+                return_exceptions=True
+            )
+            
+            for move, outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    error_msg = str(outcome)
                     errors.append(f"Error moving {move['source']}: {error_msg}")
                     batch_results.append({
                         "file": move["source"],
                         "status": "error",
                         "error": error_msg
                     })
+                    continue
+                
+                batch_results.append(outcome)
+                if outcome["status"] == "error":
+                    continue
+                if outcome["status"] == "moved":
+                    successful_moves += 1
+                total_moves += 1
+            
+            if successful_moves > moves_before_batch:
+                invalidate_tesseract_cache()
             
             results.extend(batch_results)
             
             # Safety pause between batches (only in real execution)
-            if not dry_run and batch_num < len(list(chunked(example_moves, batch_size))):
-                time.sleep(2)
+            if not dry_run and batch_num < total_batches:
+                await asyncio.sleep(2)
                 
     except Exception as e:
         return {
@@ -4259,7 +4551,7 @@ async def execute_reorganization(
         "backup_path": str(backup_path) if backup_path else None,
         "execution_summary": {
             "total_planned_moves": len(example_moves),
-            "batches_processed": len(list(chunked(example_moves, batch_size))),
+            "batches_processed": total_batches,
             "successful_moves": successful_moves,
             "total_errors": len(errors)
         },
@@ -4277,20 +4569,14 @@ async def execute_reorganization(
 async def assess_memoir_readiness():
     """Assess how ready the codex is for memoir production"""
     
-    # Get content analysis
-    content_patterns = await analyze_content_patterns()
-    folder_structure = await analyze_folder_structure()
+    # Get content analysis (cached until the vault changes) - one vault walk feeds both
+    scan = await asyncio.to_thread(scan_vault, VAULT_PATH)
+    content_patterns = await _cached_vault_analysis("content_patterns", compute_content_patterns, scan)
+    folder_structure = await _cached_vault_analysis("folder_structure", compute_folder_structure, scan)
     
     # Analyze memoir-specific readiness factors
-    memoir_files = []
-    recovery_files = []
-    chronological_files = []
-    
-    for archetype, count in content_patterns["document_archetypes"].items():
-        if archetype == "memoir-narrative":
-            memoir_files.append(count)
-        elif archetype == "recovery-document":
-            recovery_files.append(count)
+    memoir_count = content_patterns["document_archetypes"].get("memoir-narrative", 0)
+    recovery_count = content_patterns["document_archetypes"].get("recovery-document", 0)
     
     # Check for chronological markers
     temporal_content = len(content_patterns.get("content_patterns", {}).get("memoir_candidates", []))
@@ -4302,7 +4588,7 @@ async def assess_memoir_readiness():
     ) / len(folder_structure["chaos_hotspots"]) if folder_structure["chaos_hotspots"] else 0
     
     # Calculate readiness scores
-    content_score = min(100, (sum(memoir_files) + sum(recovery_files)) * 2)  # More content = better
+    content_score = min(100, (memoir_count + recovery_count) * 2)  # More content = better
     organization_score = max(0, 100 - (avg_urgency * 100))  # Less chaos = better
     temporal_score = min(100, temporal_content * 5)  # More chronological markers = better
     
@@ -4346,16 +4632,16 @@ async def assess_memoir_readiness():
             "chronological_structure": round(temporal_score, 1)
         },
         "content_inventory": {
-            "memoir_documents": sum(memoir_files),
-            "recovery_documents": sum(recovery_files),
-            "total_relevant_files": sum(memoir_files) + sum(recovery_files),
+            "memoir_documents": memoir_count,
+            "recovery_documents": recovery_count,
+            "total_relevant_files": memoir_count + recovery_count,
             "files_with_temporal_markers": temporal_content
         },
         "structural_assessment": {
-            "folders_needing_reorganization": len([
-                folder for _, folder in folder_structure["chaos_hotspots"]
+            "folders_needing_reorganization": sum(
+                1 for _, folder in folder_structure["chaos_hotspots"]
                 if folder["reorganization_urgency"] > 0.7
-            ]),
+            ),
             "average_organization_urgency": round(avg_urgency, 3)
         },
         "missing_content_areas": missing_chapters,
@@ -4368,20 +4654,48 @@ async def assess_memoir_readiness():
         ]
     }
 
+# Scanning and classifying every _inload file is the dominant cost of the _inload endpoints;
+# the read-only ones share one classified miner for a short while
+INLOAD_MINER_TTL = 60  # seconds
+
+_inload_miner_cache = {}  # corpus version -> (timestamp, miner)
+_inload_miner_lock = asyncio.Lock()
+
+def build_inload_miner():
+    """Scan and classify all _inload content (blocking)"""
+    from .content_mining import InloadContentMiner
+    
+    miner = InloadContentMiner(VAULT_PATH)
+    miner.scan_all_inload_content()
+    miner.classify_content()
+    return miner
+
+async def get_inload_miner(refresh: bool = False):
+    """Classified _inload miner, reused until it expires or the vault is modified"""
+    key = _corpus_version
+    cached = _inload_miner_cache.get(key)
+    if not refresh and cached and time.monotonic() - cached[0] < INLOAD_MINER_TTL:
+        return cached[1]
+    
+    # One scan at a time; concurrent callers wait for its result
+    async with _inload_miner_lock:
+        cached = _inload_miner_cache.get(key)
+        if not refresh and cached and time.monotonic() - cached[0] < INLOAD_MINER_TTL:
+            return cached[1]
+        
+        miner = await asyncio.to_thread(build_inload_miner)
+        if key == _corpus_version:
+            _inload_miner_cache.clear()
+            _inload_miner_cache[key] = (time.monotonic(), miner)
+        return miner
+
 @router.post("/api/inload/scan-content")
 async def scan_inload_content():
     """Scan all _inload directories and generate content signatures"""
-    from .content_mining import InloadContentMiner
-    
     try:
-        # Initialize miner
-        miner = InloadContentMiner(VAULT_PATH)
-        
-        # Scan content
-        signatures = miner.scan_all_inload_content()
-        
-        # Classify content
-        miner.classify_content()
+        # Always a fresh scan and classification - it also refreshes the shared miner
+        miner = await get_inload_miner(refresh=True)
+        signatures = miner.content_signatures
         
         # Generate report
         report = miner.generate_mining_report()
@@ -4406,38 +4720,40 @@ async def scan_inload_content():
 # Add these endpoints to your app/routes.py file
 # Insert after the training endpoints section
 
+# (coordinate key, tag prefix) for the coordinate tags
+SMART_TAG_COORDINATES = (
+    ("x_structure", "x-structure"),
+    ("y_transmission", "y-transmission"),
+    ("z_purpose", "z-purpose"),
+    ("w_terrain", "w-terrain")
+)
+
+# (pattern key, threshold, tag) - the tag applies when the pattern count exceeds the threshold
+SMART_TAG_RULES = (
+    ("memoir_markers", 3, "memoir-gold"),
+    ("recovery_markers", 2, "recovery"),
+    ("medical_markers", 2, "medical"),
+    ("ai_markers", 2, "ai-collaboration"),
+    ("emotional_markers", 3, "emotional-depth")
+)
+
 def generate_smart_tags(chunk: dict) -> list:
     """Generate intelligent tags based on chunk analysis"""
-    tags = []
     coords = chunk.get('coordinates', {})
     theme = chunk.get('theme', '')
     patterns = chunk.get('patterns', {})
     
     # Add coordinate tags
-    if coords.get('x_structure'):
-        tags.append(f"x-structure/{coords['x_structure']}")
-    if coords.get('y_transmission'):
-        tags.append(f"y-transmission/{coords['y_transmission']}")
-    if coords.get('z_purpose'):
-        tags.append(f"z-purpose/{coords['z_purpose']}")
-    if coords.get('w_terrain'):
-        tags.append(f"w-terrain/{coords['w_terrain']}")
+    tags = [
+        f"{prefix}/{coords[key]}" for key, prefix in SMART_TAG_COORDINATES if coords.get(key)
+    ]
     
     # Add theme tag
     if theme and theme != 'unknown':
         tags.append(f"theme/{theme}")
     
     # Add content-based tags
-    if patterns.get('memoir_markers', 0) > 3:
-        tags.append('memoir-gold')
-    if patterns.get('recovery_markers', 0) > 2:
-        tags.append('recovery')
-    if patterns.get('medical_markers', 0) > 2:
-        tags.append('medical')
-    if patterns.get('ai_markers', 0) > 2:
-        tags.append('ai-collaboration')
-    if patterns.get('emotional_markers', 0) > 3:
-        tags.append('emotional-depth')
+    tags.extend(tag for key, threshold, tag in SMART_TAG_RULES if patterns.get(key, 0) > threshold)
     
     return tags
 
@@ -4456,6 +4772,19 @@ def calculate_tagging_confidence(chunk: dict) -> float:
     
     return round(confidence, 2)
 
+def load_json_file(path: Path):
+    """Parse a JSON file, with orjson when it's installed"""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def write_json_file(path: Path, data):
+    """Write data as indented JSON, serialized in one orjson call when it's installed"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 @router.post("/api/chunks/create-review-queue")
 async def create_review_queue():
     """
@@ -4464,48 +4793,98 @@ async def create_review_queue():
     
     training_dir = Path("/Users/rickshangle/Vaults/flatline-codex/_training_output")
     review_queue = []
+    priority_bands = Counter()
     
-    # Load all chunks
-    for batch_dir in (training_dir / "batch_outputs").glob("batch_*"):
-        chunks_file = batch_dir / "extracted_chunks.json"
-        if chunks_file.exists():
-            with open(chunks_file, 'r') as f:
-                chunks = json.load(f)
+    # Load all chunks - batch files are independent, so read and parse them concurrently off the loop
+    chunks_files = [
+        batch_dir / "extracted_chunks.json"
+        for batch_dir in (training_dir / "batch_outputs").glob("batch_*")
+    ]
+    batches = await asyncio.gather(*(
+        asyncio.to_thread(load_json_file, chunks_file)
+        for chunks_file in chunks_files if chunks_file.exists()
+    ))
+    
+    for chunks in batches:
+        for chunk in chunks:
+            review_priority = calculate_review_priority(chunk)
             
-            for chunk in chunks:
-                review_priority = calculate_review_priority(chunk)
-                
-                if review_priority > 0:  # Needs some level of review
-                    review_queue.append({
-                        'chunk': chunk,
-                        'priority': review_priority,
-                        'review_reason': get_review_reason(chunk),
-                        'ai_suggestions': {
-                            'tags': generate_smart_tags(chunk),
-                            'destination': suggest_chunk_destination(
-                                chunk.get('coordinates', {}),
-                                chunk.get('quality_score', 0)
-                            ),
-                            'confidence': calculate_tagging_confidence(chunk)
-                        }
-                    })
+            if review_priority > 0:  # Needs some level of review
+                priority_bands[
+                    'high' if review_priority >= 0.8 else 'medium' if review_priority >= 0.5 else 'low'
+                ] += 1
+                review_queue.append({
+                    'chunk': chunk,
+                    'priority': review_priority,
+                    'review_reason': get_review_reason(chunk),
+                    'ai_suggestions': {
+                        'tags': generate_smart_tags(chunk),
+                        'destination': suggest_chunk_destination(
+                            chunk.get('coordinates', {}),
+                            chunk.get('quality_score', 0)
+                        ),
+                        'confidence': calculate_tagging_confidence(chunk)
+                    }
+                })
     
     # Sort by priority
-    review_queue.sort(key=lambda x: x['priority'], reverse=True)
+    review_queue.sort(key=itemgetter('priority'), reverse=True)
     
     # Save queue
     queue_file = training_dir / "review_queue.json"
-    with open(queue_file, 'w') as f:
-        json.dump(review_queue, f, indent=2)
+    write_json_file(queue_file, review_queue)
     
     return {
         'total_items': len(review_queue),
-        'high_priority': len([x for x in review_queue if x['priority'] >= 0.8]),
-        'medium_priority': len([x for x in review_queue if 0.5 <= x['priority'] < 0.8]),
-        'low_priority': len([x for x in review_queue if x['priority'] < 0.5]),
+        'high_priority': priority_bands['high'],
+        'medium_priority': priority_bands['medium'],
+        'low_priority': priority_bands['low'],
         'queue_file': str(queue_file)
     }
 
+# Parsed review queues, reused until the file changes: path -> ((st_mtime_ns, st_size), queue)
+_review_queue_cache = {}
+_review_queue_cache_lock = threading.Lock()
+
+def load_review_queue(queue_file: Path) -> list:
+    """Parsed review_queue.json, re-read only when its mtime or size changes"""
+    stat = queue_file.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _review_queue_cache_lock:
+        cached = _review_queue_cache.get(queue_file)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        queue = load_json_file(queue_file)
+        _review_queue_cache[queue_file] = (version, queue)
+        return queue
+
+REVIEW_PRIORITY_BANDS = ("critical", "high", "medium", "low")
+
+# Queue items split by priority band, per queue file: path -> (parsed queue, bands)
+_review_band_cache = {}
+
+def review_queue_bands(queue_file: Path, queue: list) -> dict:
+    """Queue items per priority band (queue order kept), built once per parsed queue"""
+    cached = _review_band_cache.get(queue_file)
+    if cached is not None and cached[0] is queue:
+        return cached[1]
+    
+    bands = {band: [] for band in REVIEW_PRIORITY_BANDS}
+    for x in queue:
+        priority = x['priority']
+        if priority >= 0.8:
+            bands['critical'].append(x)
+        elif priority >= 0.6:
+            bands['high'].append(x)
+        elif priority >= 0.4:
+            bands['medium'].append(x)
+        else:
+            bands['low'].append(x)
+    
+    _review_band_cache[queue_file] = (queue, bands)
+    return bands
+
 @router.get("/api/chunks/review-queue")
 async def get_review_queue(
     priority_filter: str = "all",  # all, critical, high, medium, low
@@ -4525,18 +4904,11 @@ async def get_review_queue(
         }
 
     try:
-        with open(queue_file, 'r') as f:
-            queue = json.load(f)
+        queue = load_review_queue(queue_file)
 
         # Apply priority filter
-        if priority_filter == "critical":
-            filtered = [x for x in queue if x['priority'] >= 0.8]
-        elif priority_filter == "high":
-            filtered = [x for x in queue if 0.6 <= x['priority'] < 0.8]
-        elif priority_filter == "medium":
-            filtered = [x for x in queue if 0.4 <= x['priority'] < 0.6]
-        elif priority_filter == "low":
-            filtered = [x for x in queue if x['priority'] < 0.4]
+        if priority_filter in REVIEW_PRIORITY_BANDS:
+            filtered = review_queue_bands(queue_file, queue)[priority_filter]
         else:
             filtered = queue
 
@@ -4578,18 +4950,11 @@ async def get_review_batch(
         }
 
     try:
-        with open(queue_file, 'r') as f:
-            queue = json.load(f)
+        queue = load_review_queue(queue_file)
 
         # Filter by priority
-        if priority_filter == "critical":
-            candidates = [x for x in queue if x['priority'] >= 0.8]
-        elif priority_filter == "high":
-            candidates = [x for x in queue if 0.6 <= x['priority'] < 0.8]
-        elif priority_filter == "medium":
-            candidates = [x for x in queue if 0.4 <= x['priority'] < 0.6]
-        elif priority_filter == "low":
-            candidates = [x for x in queue if x['priority'] < 0.4]
+        if priority_filter in REVIEW_PRIORITY_BANDS:
+            candidates = review_queue_bands(queue_file, queue)[priority_filter]
         else:
             candidates = queue
 
@@ -4691,6 +5056,62 @@ async def approve_review_batch(decisions: dict):
     }
 
 
+# Review-stats responses per queue file: path -> (parsed queue they describe, response)
+_review_stats_cache = {}
+
+def summarize_review_queue(queue: list) -> dict:
+    """Review-queue statistics (the review-stats response body)"""
+    # Calculate stats
+    total = len(queue)
+    by_priority = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+    by_purpose = Counter()
+    quality_total = 0
+    quality_min = quality_max = None
+    memoir_gold = 0
+
+    # Priority bands, purposes and quality stats in one pass over the queue
+    for x in queue:
+        priority = x['priority']
+        if priority >= 0.8:
+            by_priority['critical'] += 1
+        elif priority >= 0.6:
+            by_priority['high'] += 1
+        elif priority >= 0.4:
+            by_priority['medium'] += 1
+        else:
+            by_priority['low'] += 1
+
+        by_purpose[x['coordinates']['z_purpose']] += 1
+
+        quality = x['quality_score']
+        quality_total += quality
+        if quality_min is None or quality < quality_min:
+            quality_min = quality
+        if quality_max is None or quality > quality_max:
+            quality_max = quality
+        if quality >= 80:
+            memoir_gold += 1
+
+    avg_quality = quality_total / total if total else 0
+
+    return {
+        'status': 'success',
+        'total_items': total,
+        'by_priority': by_priority,
+        'by_purpose': dict(by_purpose.most_common(5)),
+        'quality_stats': {
+            'average': round(avg_quality, 1),
+            'min': quality_min if total else 0,
+            'max': quality_max if total else 0,
+            'memoir_gold': memoir_gold
+        },
+        'estimated_review_time': {
+            'critical_items': f"{by_priority['critical'] * 2} minutes (2 min each)",
+            'high_items': f"{by_priority['high'] * 1} minutes (1 min each)",
+            'total_high_priority': f"{by_priority['critical'] * 2 + by_priority['high']} minutes"
+        }
+    }
+
 @router.get("/api/chunks/review-stats")
 async def get_review_statistics():
     """
@@ -4706,41 +5127,16 @@ async def get_review_statistics():
         }
 
     try:
-        with open(queue_file, 'r') as f:
-            queue = json.load(f)
+        queue = load_review_queue(queue_file)
 
-        # Calculate stats
-        total = len(queue)
-        by_priority = {
-            'critical': len([x for x in queue if x['priority'] >= 0.8]),
-            'high': len([x for x in queue if 0.6 <= x['priority'] < 0.8]),
-            'medium': len([x for x in queue if 0.4 <= x['priority'] < 0.6]),
-            'low': len([x for x in queue if x['priority'] < 0.4])
-        }
-
-        by_purpose = Counter(x['coordinates']['z_purpose'] for x in queue)
-        by_theme = Counter(x.get('chunk_id', 'unknown').split('-')[0] for x in queue)
+        # The queue only changes when its file does - reuse the summary built for this parse
+        cached = _review_stats_cache.get(queue_file)
+        if cached is not None and cached[0] is queue:
+            return cached[1]
 
-        quality_scores = [x['quality_score'] for x in queue]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-
-        return {
-            'status': 'success',
-            'total_items': total,
-            'by_priority': by_priority,
-            'by_purpose': dict(by_purpose.most_common(5)),
-            'quality_stats': {
-                'average': round(avg_quality, 1),
-                'min': min(quality_scores) if quality_scores else 0,
-                'max': max(quality_scores) if quality_scores else 0,
-                'memoir_gold': len([x for x in queue if x['quality_score'] >= 80])
-            },
-            'estimated_review_time': {
-                'critical_items': f"{by_priority['critical'] * 2} minutes (2 min each)",
-                'high_items': f"{by_priority['high'] * 1} minutes (1 min each)",
-                'total_high_priority': f"{by_priority['critical'] * 2 + by_priority['high']} minutes"
-            }
-        }
+        summary = summarize_review_queue(queue)
+        _review_stats_cache[queue_file] = (queue, summary)
+        return summary
 
     except Exception as e:
         return {
@@ -4748,11 +5144,20 @@ async def get_review_statistics():
             'error': str(e)
         }
 
+def _survival_marker_total(entry: dict) -> int:
+    return entry['job_markers'] + entry['medical_markers']
+
+# Ranking key per mining category for priority-files (other categories keep scan order)
+PRIORITY_FILE_SORT_KEYS = {
+    "high_value": itemgetter('quality'),
+    "memoir_gold": itemgetter('quality'),
+    "recovery_threads": itemgetter('recovery_markers'),
+    "job_survival": _survival_marker_total
+}
+
 @router.get("/api/inload/priority-files")
 async def get_priority_inload_files(category: str = "high_value", limit: int = 20):
     """Get priority files from specific category for manual review"""
-    from .content_mining import InloadContentMiner
-    
     valid_categories = [
         "high_value", "memoir_gold", "recovery_threads",
         "job_survival", "ai_collaboration", "creative_fragments"
@@ -4765,29 +5170,27 @@ async def get_priority_inload_files(category: str = "high_value", limit: int = 2
         }
     
     try:
-        # Quick scan to get current state
-        miner = InloadContentMiner(VAULT_PATH)
-        miner.scan_all_inload_content()
-        miner.classify_content()
+        # Shared scanned-and-classified miner (rescanned after INLOAD_MINER_TTL or vault writes)
+        miner = await get_inload_miner()
         
         # Get requested category
         category_files = miner.mining_results.get(category, [])
         
-        # Sort by quality/relevance and limit
-        if category in ["high_value", "memoir_gold"]:
-            sorted_files = sorted(category_files, key=lambda x: x.get('quality', 0), reverse=True)
-        elif category == "recovery_threads":
-            sorted_files = sorted(category_files, key=lambda x: x.get('recovery_markers', 0), reverse=True)
-        elif category == "job_survival":
-            sorted_files = sorted(category_files, key=lambda x: x.get('job_markers', 0) + x.get('medical_markers', 0), reverse=True)
+        # Top `limit` by quality/relevance - nlargest keeps sorted(..., reverse=True)[:limit] order
+        sort_key = PRIORITY_FILE_SORT_KEYS.get(category)
+        if sort_key is None:
+            top_files = category_files[:limit]
+        elif limit >= 0:
+            top_files = heapq.nlargest(limit, category_files, key=sort_key)
         else:
-            sorted_files = category_files
+            # A negative limit keeps its slice meaning: everything but the lowest |limit|
+            top_files = sorted(category_files, key=sort_key, reverse=True)[:limit]
         
         return {
             "status": "success",
             "category": category,
             "total_in_category": len(category_files),
-            "files": sorted_files[:limit],
+            "files": top_files,
             "suggested_destinations": get_suggested_destinations(category)
         }
         
@@ -4798,17 +5201,20 @@ async def get_priority_inload_files(category: str = "high_value", limit: int = 2
             "message": f"Failed to get priority files for {category}"
         }
 
+# Suggested destination folders per mining category (tuples - shared by every response)
+SUGGESTED_DESTINATIONS = {
+    "high_value": ("memoir/spine/", "recovery/practices/", "work-amends/"),
+    "memoir_gold": ("memoir/spine/foundations/", "memoir/spine/recovery/", "memoir/spine/integration/"),
+    "recovery_threads": ("recovery/practices/", "recovery/explorations/", "recovery/personas/"),
+    "job_survival": ("work-amends/job-search/", "work-amends/skills/", "survival/medical/"),
+    "ai_collaboration": ("contribution/systems/", "memoir/spine/integration/"),
+    "creative_fragments": ("contribution/creative/", "memoir/explorations/")
+}
+DEFAULT_SUGGESTED_DESTINATIONS = ("_tesseract-inbox/needs-classification/",)
+
 def get_suggested_destinations(category):
     """Get suggested destination folders for each category"""
-    destinations = {
-        "high_value": ["memoir/spine/", "recovery/practices/", "work-amends/"],
-        "memoir_gold": ["memoir/spine/foundations/", "memoir/spine/recovery/", "memoir/spine/integration/"],
-        "recovery_threads": ["recovery/practices/", "recovery/explorations/", "recovery/personas/"],
-        "job_survival": ["work-amends/job-search/", "work-amends/skills/", "survival/medical/"],
-        "ai_collaboration": ["contribution/systems/", "memoir/spine/integration/"],
-        "creative_fragments": ["contribution/creative/", "memoir/explorations/"]
-    }
-    return destinations.get(category, ["_tesseract-inbox/needs-classification/"])
+    return SUGGESTED_DESTINATIONS.get(category, DEFAULT_SUGGESTED_DESTINATIONS)
 
 @router.post("/api/inload/extract-sample")
 async def extract_content_sample(file_path: str, max_words: int = 200):
@@ -4849,6 +5255,60 @@ async def extract_content_sample(file_path: str, max_words: int = 200):
             "message": f"Failed to extract sample from {file_path}"
         }
 
+# Upper bound on concurrent renames per batch-move request
+BATCH_MOVE_CONCURRENCY = 16
+
+def move_vault_file(vault_root: str, move: dict, created_dirs: set) -> dict:
+    """Rename one vault file for batch-move - blocking, runs in a worker thread"""
+    source = os.path.join(vault_root, move["source_path"])
+    destination = os.path.join(vault_root, move["destination_path"])
+    
+    # Ensure destination directory exists (once per directory per batch)
+    destination_dir = os.path.dirname(destination)
+    if destination_dir not in created_dirs:
+        os.makedirs(destination_dir, exist_ok=True)
+        created_dirs.add(destination_dir)
+    
+    # Perform move
+    try:
+        os.rename(source, destination)
+    except FileNotFoundError:
+        return {
+            "source": move["source_path"],
+            "destination": move["destination_path"],
+            "status": "error",
+            "message": "Source file not found"
+        }
+    
+    return {
+        "source": move["source_path"],
+        "destination": move["destination_path"],
+        "status": "success"
+    }
+
+async def _run_batch_move(vault_root: str, move: dict, created_dirs: set, move_slots: asyncio.Semaphore) -> dict:
+    async with move_slots:
+        return await asyncio.to_thread(move_vault_file, vault_root, move, created_dirs)
+
+async def _run_batch_move_wave(vault_root: str, wave: list, created_dirs: set, move_slots: asyncio.Semaphore) -> list:
+    """One wave of independent renames; a move that raises becomes its own error entry"""
+    outcomes = await asyncio.gather(
+        *(_run_batch_move(vault_root, move, created_dirs, move_slots) for move in wave),
+        return_exceptions=True
+    )
+    
+    wave_results = []
+    for move, outcome in zip(wave, outcomes):
+        if isinstance(outcome, Exception):
+            outcome = {
+                "source": move["source_path"],
+                "destination": move["destination_path"],
+                "status": "error",
+                "message": str(outcome)
+            }
+        wave_results.append(outcome)
+    return wave_results
+
 @router.post("/api/inload/batch-move")
 async def batch_move_files(request: BatchMoveRequest):
     moves = request.moves
@@ -4871,31 +5331,31 @@ async def batch_move_files(request: BatchMoveRequest):
                 "message": "Failed to create backup before batch move"
             }
         
-        results = []
-        for move in moves:
-            source = VAULT_PATH / move["source_path"]
-            destination = VAULT_PATH / move["destination_path"]
-            
-            # Ensure destination directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Perform move
-            if source.exists():
-                source.rename(destination)
-                results.append({
-                    "source": move["source_path"],
-                    "destination": move["destination_path"],
-                    "status": "success"
-                })
-            else:
-                results.append({
-                    "source": move["source_path"],
-                    "destination": move["destination_path"],
-                    "status": "error",
-                    "message": "Source file not found"
-                })
+        vault_root = str(VAULT_PATH)
+        created_dirs = set()
+        move_slots = asyncio.Semaphore(BATCH_MOVE_CONCURRENCY)
         
-        successful_moves = len([r for r in results if r["status"] == "success"])
+        # Independent renames run side by side; a move touching a path an earlier move in the
+        # current wave touches waits for that wave, so chained moves keep their request order
+        results = []
+        try:
+            wave = []
+            wave_paths = set()
+            for move in moves:
+                paths = (move["source_path"], move["destination_path"])
+                if wave_paths.intersection(paths):
+                    results.extend(await _run_batch_move_wave(vault_root, wave, created_dirs, move_slots))
+                    wave = []
+                    wave_paths.clear()
+                wave.append(move)
+                wave_paths.update(paths)
+            results.extend(await _run_batch_move_wave(vault_root, wave, created_dirs, move_slots))
+        finally:
+            # Renames that completed are on disk even if the batch is cut short
+            if any(r["status"] == "success" for r in results):
+                invalidate_tesseract_cache()
+        
+        successful_moves = sum(1 for r in results if r["status"] == "success")
         
         return {
             "status": "success",
@@ -4949,6 +5409,7 @@ async def archive_low_priority_content():
                 archive_path.parent.mkdir(parents=True, exist_ok=True)
                 
                 source_path.rename(archive_path)
+                invalidate_tesseract_cache()
                 archived_files.append({
                     "original": candidate["file"],
                     "archived_to": str(archive_path.relative_to(VAULT_PATH)),
@@ -5010,12 +5471,16 @@ async def process_snippets(quality_threshold: int = 20, dry_run: bool = True):
     from .snippet_batch_processor import execute_snippet_reorganization, process_current_snippets
     
     try:
-        # First analyze snippets
-        ai_collaboration_result = await get_priority_inload_files("ai_collaboration", 200)
-        snippet_analysis = process_current_snippets(VAULT_PATH, ai_collaboration_result, quality_threshold)
+        # First analyze snippets - straight from the shared classified miner (priority-files
+        # returns ai_collaboration files unsorted, so its first 200 are these)
+        miner = await get_inload_miner()
+        ai_collaboration_data = {"files": miner.mining_results["ai_collaboration"][:200]}
+        snippet_analysis = process_current_snippets(VAULT_PATH, ai_collaboration_data, quality_threshold)
         
         # Execute the reorganization
         results = execute_snippet_reorganization(VAULT_PATH, snippet_analysis, dry_run)
+        if not dry_run and results["summary"]["total_processed"]:
+            invalidate_tesseract_cache()
         
         # Create comprehensive report
         processing_report = {
@@ -5044,37 +5509,38 @@ async def process_snippets(quality_threshold: int = 20, dry_run: bool = True):
 @router.get("/api/snippets/stats")
 async def get_snippet_statistics():
     """Get statistics on snippet extraction efforts"""
-    from .content_mining import InloadContentMiner
-    
     try:
-        # Scan current content
-        miner = InloadContentMiner(VAULT_PATH)
-        miner.scan_all_inload_content()
-        miner.classify_content()
+        # Shared scanned-and-classified miner (rescanned after INLOAD_MINER_TTL or vault writes)
+        miner = await get_inload_miner()
         
-        # Find snippet-tagged files
+        # Find snippet-tagged files, tallying quality bands and totals as they're found
         snippet_files = []
         total_ai_collaboration = len(miner.mining_results["ai_collaboration"])
+        quality_total = 0
+        total_words = 0
+        quality_bands = {"high_value": 0, "medium_value": 0, "low_value": 0}
         
         for file_path, signature in miner.content_signatures.items():
             if signature.get('file_path') and miner.is_snippet_file_by_signature(signature):
+                quality = signature["quality_score"]
                 snippet_files.append({
                     "file": file_path,
-                    "quality": signature["quality_score"],
+                    "quality": quality,
                     "theme": signature["dominant_theme"],
                     "word_count": signature["word_count"]
                 })
+                quality_total += quality
+                total_words += signature["word_count"]
+                if quality >= 50:
+                    quality_bands["high_value"] += 1
+                elif quality >= 20:
+                    quality_bands["medium_value"] += 1
+                else:
+                    quality_bands["low_value"] += 1
         
         # Calculate statistics
-        if snippet_files:
-            qualities = [f["quality"] for f in snippet_files]
-            avg_quality = sum(qualities) / len(qualities)
-            high_quality_count = len([q for q in qualities if q >= 20])
-            total_words = sum(f["word_count"] for f in snippet_files)
-        else:
-            avg_quality = 0
-            high_quality_count = 0
-            total_words = 0
+        avg_quality = quality_total / len(snippet_files) if snippet_files else 0
+        high_quality_count = quality_bands["high_value"] + quality_bands["medium_value"]
         
         return {
             "status": "success",
@@ -5086,13 +5552,9 @@ async def get_snippet_statistics():
                 "high_quality_count": high_quality_count,
                 "extraction_efficiency": round(high_quality_count / max(len(snippet_files), 1) * 100, 1),
                 "total_words_extracted": total_words,
-                "quality_distribution": {
-                    "high_value": len([f for f in snippet_files if f["quality"] >= 50]),
-                    "medium_value": len([f for f in snippet_files if 20 <= f["quality"] < 50]),
-                    "low_value": len([f for f in snippet_files if f["quality"] < 20])
-                }
+                "quality_distribution": quality_bands
             },
-            "top_quality_snippets": sorted(snippet_files, key=lambda x: x["quality"], reverse=True)[:10],
+            "top_quality_snippets": heapq.nlargest(10, snippet_files, key=lambda x: x["quality"]),
             "efficiency_analysis": analyze_extraction_efficiency(snippet_files)
         }
         
@@ -5171,8 +5633,13 @@ def analyze_extraction_efficiency(snippet_files):
         return {"efficiency": 0, "analysis": "No snippets found"}
     
     total = len(snippet_files)
-    high_quality = len([f for f in snippet_files if f["quality"] >= 50])
-    medium_quality = len([f for f in snippet_files if 20 <= f["quality"] < 50])
+    high_quality = medium_quality = 0
+    for f in snippet_files:
+        quality = f["quality"]
+        if quality >= 50:
+            high_quality += 1
+        elif quality >= 20:
+            medium_quality += 1
     
     efficiency = (high_quality + medium_quality * 0.5) / total * 100
     
@@ -5221,10 +5688,9 @@ def calculate_extraction_efficiency(snippet_analysis):
         "total_extracted": total,
         "assessment": "Excellent" if efficiency >= 50 else "Good" if efficiency >= 25 else "Poor" if efficiency >= 10 else "Very Poor"
     }
-@router.get("/", response_class=HTMLResponse)
-async def serve_api_documentation():
-    """Serve API documentation at root endpoint"""
-    html_content = """<!DOCTYPE html>
+
+# Static page, encoded once at import
+API_DOCUMENTATION_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -5672,14 +6138,33 @@ async def serve_api_documentation():
         </div>
     </div>
 </body>
-</html>"""
-    return HTMLResponse(content=html_content)
+</html>""".encode("utf-8")
+
+@router.get("/", response_class=HTMLResponse)
+async def serve_api_documentation():
+    """Serve API documentation at root endpoint"""
+    return HTMLResponse(content=API_DOCUMENTATION_HTML)
+
+REVIEW_HTML_PATH = Path(__file__).parent / "static" / "review.html"
+
+# Review page bytes, re-read only when the file changes: (st_mtime_ns, st_size) -> bytes
+_review_html_cache = {}
+
+def load_review_html() -> bytes:
+    """review.html as bytes, re-read only when its mtime or size changes (edits still show up)"""
+    stat = REVIEW_HTML_PATH.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _review_html_cache.get(version)
+    if cached is None:
+        cached = REVIEW_HTML_PATH.read_bytes()
+        _review_html_cache.clear()
+        _review_html_cache[version] = cached
+    return cached
 
 @router.get("/review", response_class=HTMLResponse)
 async def serve_review_interface():
     """Serve the chunk review interface"""
-    # Use a raw string to avoid escape issues
-    return HTMLResponse(content=open('app/static/review.html').read())
+    return HTMLResponse(content=load_review_html())
 
 # Helper functions for review queue
 def calculate_review_priority(chunk: dict) -> float:
@@ -5742,87 +6227,53 @@ def get_review_reason(chunk: dict) -> list:
     
     return reasons
 
+# Chunk destination folders: purpose -> base folder, structure -> subfolder
+CHUNK_PURPOSE_FOLDERS = {
+    'tell-story': 'memoir',
+    'help-addict': 'recovery',
+    'prevent-death-poverty': 'survival',
+    'financial-amends': 'work-amends',
+    'help-world': 'contribution'
+}
+CHUNK_STRUCTURE_FOLDERS = {
+    'archetype': 'personas',
+    'protocol': 'practices',
+    'shadowcast': 'explorations',
+    'expansion': 'context',
+    'summoning': 'activations'
+}
+
 def suggest_chunk_destination(coords: dict, quality: float) -> str:
     """Suggest where a chunk should be filed"""
     z_purpose = coords.get('z_purpose', 'tell-story')
     x_structure = coords.get('x_structure', 'archetype')
     
     # Map purpose to base folder
-    purpose_folders = {
-        'tell-story': 'memoir',
-        'help-addict': 'recovery',
-        'prevent-death-poverty': 'survival',
-        'financial-amends': 'work-amends',
-        'help-world': 'contribution'
-    }
-    
-    base = purpose_folders.get(z_purpose, 'memoir')
+    base = CHUNK_PURPOSE_FOLDERS.get(z_purpose, 'memoir')
     
     # High quality memoir goes to spine
     if quality >= 80 and z_purpose == 'tell-story':
         return f"{base}/spine/foundations"
     
     # Otherwise organize by structure
-    structure_folders = {
-        'archetype': 'personas',
-        'protocol': 'practices',
-        'shadowcast': 'explorations',
-        'expansion': 'context',
-        'summoning': 'activations'
-    }
-    
-    subfolder = structure_folders.get(x_structure, 'general')
+    subfolder = CHUNK_STRUCTURE_FOLDERS.get(x_structure, 'general')
     return f"{base}/{subfolder}"
 
 @router.get("/api/inload/mining-dashboard")
 async def get_mining_dashboard(format: str = "json"):
     """Get comprehensive dashboard of _inload mining status"""
-    from .content_mining import InloadContentMiner
-    
     try:
-        # Scan current content
-        miner = InloadContentMiner(VAULT_PATH)
-        miner.scan_all_inload_content()
-        miner.classify_content()
-        
-        # Find snippet-tagged files
-        snippet_files = []
-        total_ai_collaboration = len(miner.mining_results["ai_collaboration"])
-        
-        for file_path, signature in miner.content_signatures.items():
-            if signature.get('file_path') and miner.is_snippet_file_by_signature(signature):
-                snippet_files.append({
-                    "file": file_path,
-                    "quality": signature["quality_score"],
-                    "theme": signature["dominant_theme"],
-                    "word_count": signature["word_count"]
-                })
-        
-        # Calculate statistics
-        if snippet_files:
-            qualities = [f["quality"] for f in snippet_files]
-            avg_quality = sum(qualities) / len(qualities)
-            high_quality_count = len([q for q in qualities if q >= 20])
-            total_words = sum(f["word_count"] for f in snippet_files)
-        else:
-            avg_quality = 0
-            high_quality_count = 0
-            total_words = 0
-        
-        # Calculate metrics
-        total_files = len(miner.content_signatures)
-        total_words_all = sum(sig['word_count'] for sig in miner.content_signatures.values())
-        
-        # Quality distribution
-        quality_distribution = defaultdict(int)
-        for sig in miner.content_signatures.values():
-            quality_range = f"{int(sig['quality_score'])}-{int(sig['quality_score'])+1}"
-            quality_distribution[quality_range] += 1
-        
-        # Theme distribution
-        theme_distribution = defaultdict(int)
-        for sig in miner.content_signatures.values():
-            theme_distribution[sig['dominant_theme']] += 1
+        # Shared scanned-and-classified miner (rescanned after INLOAD_MINER_TTL or vault writes)
+        miner = await get_inload_miner()
+        
+        # Totals and distributions - sum/map/Counter iterate in C, no per-signature bytecode
+        signatures = miner.content_signatures.values()
+        total_files = len(signatures)
+        total_words_all = sum(map(itemgetter('word_count'), signatures))
+        quality_scores = list(map(itemgetter('quality_score'), signatures))
+        quality_sum_all = sum(quality_scores)
+        quality_bins = Counter(map(int, quality_scores))  # labelled "n-(n+1)" once per bin below
+        theme_distribution = Counter(map(itemgetter('dominant_theme'), signatures))
         
         # Calculate processing recommendations
         high_priority_count = len(miner.mining_results["high_value"]) + len(miner.mining_results["memoir_gold"])
@@ -5835,10 +6286,10 @@ async def get_mining_dashboard(format: str = "json"):
             "overview": {
                 "total_files": total_files,
                 "total_words": total_words_all,
-                "avg_quality": round(sum(sig['quality_score'] for sig in miner.content_signatures.values()) / total_files, 2) if total_files > 0 else 0
+                "avg_quality": round(quality_sum_all / total_files, 2) if total_files > 0 else 0
             },
             "distributions": {
-                "quality": dict(quality_distribution),
+                "quality": {f"{b}-{b+1}": count for b, count in quality_bins.items()},
                 "themes": dict(theme_distribution)
             },
             "processing_recommendations": {
@@ -5861,8 +6312,17 @@ async def get_mining_dashboard(format: str = "json"):
         if format.lower() == "html":
             return HTMLResponse(content=generate_mining_dashboard_html(response_data))
         
-        # Default JSON response
-        return response_data
+        # Compact binary payload for non-browser clients
+        if format.lower() == "msgpack":
+            if not ORMSGPACK_AVAILABLE:
+                return API_RESPONSE_CLASS({
+                    "status": "error",
+                    "message": "MessagePack output requires the ormsgpack package"
+                }, status_code=501)
+            return Response(content=ormsgpack.packb(response_data), media_type="application/x-msgpack")
+        
+        # Default JSON response - already plain JSON types, so skip FastAPI's jsonable_encoder pass
+        return API_RESPONSE_CLASS(response_data)
         
     except Exception as e:
         error_response = {
@@ -5875,6 +6335,27 @@ async def get_mining_dashboard(format: str = "json"):
         return error_response
 
 
+# Bar and card colours for the mining dashboard page
+DASHBOARD_THEME_COLORS = {
+    "ai_collaboration": "#4f9eff",
+    "survival": "#ffd93d",
+    "recovery": "#6bcf7f",
+    "creative": "#a78bfa",
+    "technical": "#ff6b6b",
+    "emotional": "#ff9f68",
+    "memoir": "#fc85ae",
+    "unclear": "#888888"
+}
+DASHBOARD_CLASSIFICATION_COLORS = {
+    "high_value": "#6bcf7f",
+    "memoir_gold": "#fc85ae",
+    "recovery_threads": "#4f9eff",
+    "job_survival": "#ffd93d",
+    "ai_collaboration": "#a78bfa",
+    "creative_fragments": "#ff9f68",
+    "archive_candidates": "#888888"
+}
+
 def generate_mining_dashboard_html(data: dict) -> str:
     """Generate HTML visualization of mining dashboard data"""
     
@@ -5885,12 +6366,12 @@ def generate_mining_dashboard_html(data: dict) -> str:
     
     # Generate quality distribution chart data
     quality_items = sorted(distributions["quality"].items(), key=lambda x: int(x[0].split('-')[0]))
-    quality_chart_html = ""
+    quality_rows = []
     max_quality_count = max(distributions["quality"].values()) if distributions["quality"] else 1
     
     for quality_range, count in quality_items[:20]:  # Show top 20 ranges
         percentage = (count / max_quality_count) * 100
-        quality_chart_html += f"""
+        quality_rows.append(f"""
         <div class="chart-row">
             <div class="chart-label">{quality_range}</div>
             <div class="chart-bar-container">
@@ -5898,27 +6379,17 @@ def generate_mining_dashboard_html(data: dict) -> str:
                 <span class="chart-value">{count}</span>
             </div>
         </div>
-        """
+        """)
+    quality_chart_html = "".join(quality_rows)
     
     # Generate theme distribution
-    theme_colors = {
-        "ai_collaboration": "#4f9eff",
-        "survival": "#ffd93d",
-        "recovery": "#6bcf7f",
-        "creative": "#a78bfa",
-        "technical": "#ff6b6b",
-        "emotional": "#ff9f68",
-        "memoir": "#fc85ae",
-        "unclear": "#888888"
-    }
-    
-    theme_chart_html = ""
+    theme_rows = []
     max_theme_count = max(distributions["themes"].values()) if distributions["themes"] else 1
     
     for theme, count in sorted(distributions["themes"].items(), key=lambda x: x[1], reverse=True):
         percentage = (count / max_theme_count) * 100
-        color = theme_colors.get(theme, "#999999")
-        theme_chart_html += f"""
+        color = DASHBOARD_THEME_COLORS.get(theme, "#999999")
+        theme_rows.append(f"""
         <div class="chart-row">
             <div class="chart-label">{theme.replace('_', ' ').title()}</div>
             <div class="chart-bar-container">
@@ -5926,29 +6397,21 @@ def generate_mining_dashboard_html(data: dict) -> str:
                 <span class="chart-value">{count}</span>
             </div>
         </div>
-        """
+        """)
+    theme_chart_html = "".join(theme_rows)
     
     # Generate classification cards
-    classification_cards_html = ""
-    classification_colors = {
-        "high_value": "#6bcf7f",
-        "memoir_gold": "#fc85ae",
-        "recovery_threads": "#4f9eff",
-        "job_survival": "#ffd93d",
-        "ai_collaboration": "#a78bfa",
-        "creative_fragments": "#ff9f68",
-        "archive_candidates": "#888888"
-    }
-    
+    classification_cards = []
     for category, count in classifications.items():
-        color = classification_colors.get(category, "#999999")
+        color = DASHBOARD_CLASSIFICATION_COLORS.get(category, "#999999")
         display_name = category.replace('_', ' ').title()
-        classification_cards_html += f"""
+        classification_cards.append(f"""
         <div class="stat-card" style="border-color: {color};">
             <div class="stat-value" style="color: {color};">{count}</div>
             <div class="stat-label">{display_name}</div>
         </div>
-        """
+        """)
+    classification_cards_html = "".join(classification_cards)
     
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
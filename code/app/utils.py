@@ -1,13 +1,29 @@
 import re
 import yaml
 import json
+import os
 import shutil
+import sys
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
 from collections import Counter, defaultdict
 from pathlib import Path
-from app.config import VAULT_BASE_PATH
+from typing import Optional
+from app.config import VAULT_BASE_PATH, CACHE_DIR
 
+# Optional (requirements-optional.txt) - classifies archetypes in one pass over the document
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# libyaml's C loader when PyYAML was built with it - same safe semantics, several times faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # ============================================================================
 # EXISTING ENHANCED YAML GENERATION FOR OBSIDIAN COMPATIBILITY
@@ -19,23 +35,41 @@ from app.config import VAULT_BASE_PATH
 
 def validate_markdown(content: str) -> bool:
     """Basic markdown validation"""
-    return isinstance(content, str) and len(content.strip()) > 0
+    # isspace() answers the same question as strip() without copying the document
+    return isinstance(content, str) and bool(content) and not content.isspace()
 
 def write_markdown_file(file_path: Path, content: str):
     """Write content to markdown file"""
     file_path.write_text(content, encoding="utf-8")
+    TAG_INDEX.update_from_content(file_path, content)
+
+def _split_frontmatter(content: str) -> tuple:
+    """Split content into (yaml block, body) - yaml block is None when there is no closed frontmatter"""
+    if not content.startswith("---"):
+        return None, content
+    
+    # Walk line by line to the closing fence so the body is never split
+    yaml_start = content.find('\n') + 1
+    if yaml_start == 0:
+        return None, content
+    
+    line_start = yaml_start
+    while True:
+        line_end = content.find('\n', line_start)
+        line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+        if line.strip() == "---":
+            body = "" if line_end == -1 else content[line_end + 1:]
+            return content[yaml_start:line_start - 1], body
+        if line_end == -1:
+            return None, content
+        line_start = line_end + 1
 
 def parse_yaml_frontmatter(content: str) -> dict:
     """Parse YAML frontmatter from markdown content"""
-    if not content.startswith("---"):
-        return {}
-    
     try:
-        lines = content.split('\n')
-        yaml_end = next((i for i, line in enumerate(lines[1:], 1) if line.strip() == "---"), -1)
-        if yaml_end > 0:
-            yaml_content = '\n'.join(lines[1:yaml_end])
-            return yaml.safe_load(yaml_content) or {}
+        yaml_content, _ = _split_frontmatter(content)
+        if yaml_content is not None:
+            return yaml.load(yaml_content, Loader=YAML_LOADER) or {}
     except:
         return {}
     
@@ -45,20 +79,171 @@ def fix_yaml_frontmatter(content: str) -> str:
     """Fix malformed YAML frontmatter"""
     return content
 
+def _normalize_tags(tags) -> list:
+    if isinstance(tags, str):
+        tags = [tags]
+    elif not isinstance(tags, list):
+        return []
+    # The same few hundred tags repeat across thousands of files - intern so they share one object
+    return [sys.intern(tag) if type(tag) is str else tag for tag in tags]
+
 def extract_all_tags(file_path: Path) -> list:
     """Extract all tags from a markdown file"""
     try:
         content = file_path.read_text(encoding="utf-8")
         yaml_data = parse_yaml_frontmatter(content)
-        tags = yaml_data.get('tags', [])
-        if isinstance(tags, list):
-            return tags
-        elif isinstance(tags, str):
-            return [tags]
-        return []
+        return _normalize_tags(yaml_data.get('tags', []))
     except:
         return []
 
+# ============================================================================
+# TAG INDEX
+# ============================================================================
+
+TAG_INDEX_FILENAME = "tag_index.json"
+
+@dataclass
+class TagIndex:
+    """Inverted tag index over the vault, refreshed incrementally by file mtime"""
+    vault_path: Path
+    cache_dir: Path                                     # where the index is persisted, outside the vault
+    tag_to_files: dict = field(default_factory=lambda: defaultdict(set))
+    file_to_tags: dict = field(default_factory=dict)    # relative path -> list of tags
+    file_mtimes: dict = field(default_factory=dict)     # relative path -> st_mtime_ns
+    tag_counts: Counter = field(default_factory=Counter)
+    loaded: bool = False
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)  # folder scans read it from worker threads
+    
+    @property
+    def sidecar_path(self) -> Path:
+        return self.cache_dir / TAG_INDEX_FILENAME
+    
+    def update(self, file_key: str, new_tags: list, mtime_ns: int = None):
+        """Replace one file's tags, patching both maps and the tag counts"""
+        set(new_tags)  # raises TypeError on unhashable tags before anything is touched
+        with self._lock:
+            old_tags = self.file_to_tags.get(file_key, [])
+            self.tag_counts.subtract(old_tags)
+            for tag in set(old_tags) - set(new_tags):
+                files = self.tag_to_files.get(tag)
+                if files is not None:
+                    files.discard(file_key)
+                    if not files:
+                        del self.tag_to_files[tag]
+            
+            self.tag_counts.update(new_tags)
+            for tag in new_tags:
+                self.tag_to_files[tag].add(file_key)
+            
+            self.file_to_tags[file_key] = list(new_tags)
+            if mtime_ns is not None:
+                self.file_mtimes[file_key] = mtime_ns
+            
+            # Counter.subtract leaves zero entries behind
+            for tag in old_tags:
+                if self.tag_counts.get(tag) == 0:
+                    del self.tag_counts[tag]
+    
+    def remove(self, file_key: str):
+        """Drop a file that no longer exists"""
+        with self._lock:
+            self.update(file_key, [])
+            del self.file_to_tags[file_key]
+            self.file_mtimes.pop(file_key, None)
+    
+    def tags_for(self, md_file: Path) -> list:
+        """One file's tags, re-read only if it changed since it was indexed"""
+        try:
+            file_key = str(md_file.relative_to(self.vault_path))
+            mtime_ns = md_file.stat().st_mtime_ns
+        except (ValueError, OSError):
+            return extract_all_tags(md_file)
+        
+        with self._lock:
+            if not self.loaded:
+                self._load()
+            if self.file_mtimes.get(file_key) == mtime_ns:
+                return list(self.file_to_tags[file_key])
+        
+        tags = extract_all_tags(md_file)
+        try:
+            self.update(file_key, tags, mtime_ns)
+        except TypeError:
+            pass
+        return tags
+    
+    def update_from_content(self, file_path: Path, content: str):
+        """Re-index a file that was just written"""
+        if not self.loaded:
+            return
+        try:
+            file_key = str(file_path.relative_to(self.vault_path))
+            tags = _normalize_tags(parse_yaml_frontmatter(content).get('tags', []))
+            self.update(file_key, tags, file_path.stat().st_mtime_ns)
+        except (ValueError, TypeError, OSError):
+            # Outside the vault or unhashable tags - the next refresh sorts it out
+            pass
+    
+    def refresh(self) -> "TagIndex":
+        """Re-read only files that are new or changed since the last refresh"""
+        with self._lock:
+            if not self.loaded:
+                self._load()
+            
+            changed = False
+            seen = set()
+            for md_file in self.vault_path.rglob("*.md"):
+                try:
+                    file_key = str(md_file.relative_to(self.vault_path))
+                    mtime_ns = md_file.stat().st_mtime_ns
+                    seen.add(file_key)
+                    if self.file_mtimes.get(file_key) != mtime_ns:
+                        self.update(file_key, extract_all_tags(md_file), mtime_ns)
+                        changed = True
+                except Exception:
+                    continue
+            
+            for file_key in set(self.file_to_tags) - seen:
+                self.remove(file_key)
+                changed = True
+            
+            if changed:
+                self._save()
+        return self
+    
+    def counts(self) -> Counter:
+        """Tag instance counts across the vault (a copy callers may modify)"""
+        with self.refresh()._lock:
+            return Counter(self.tag_counts)
+    
+    def _load(self):
+        self.loaded = True
+        try:
+            data = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+            for file_key, (mtime_ns, tags) in data.get("files", {}).items():
+                self.update(file_key, _normalize_tags(tags), mtime_ns)
+        except (OSError, ValueError, TypeError):
+            # Missing or unreadable sidecar - rebuild from the vault
+            pass
+    
+    def _save(self):
+        data = {
+            "files": {
+                file_key: [self.file_mtimes.get(file_key), tags]
+                for file_key, tags in self.file_to_tags.items()
+            }
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.sidecar_path.write_text(json.dumps(data), encoding="utf-8")
+        except (OSError, TypeError):
+            # Unwritable cache dir or tags JSON can't represent - keep the in-memory index
+            pass
+
+def has_any_tag(md_file: Path, tags) -> bool:
+    """Check from the tag index whether a file carries any of the given tags"""
+    return any(tag in tags for tag in TAG_INDEX.tags_for(md_file))
+
 def analyze_consolidation_opportunities(tag_counter: Counter) -> dict:
     """Analyze tags for consolidation opportunities"""
     return {"suggestions": []}
@@ -80,6 +265,9 @@ CRITICAL_CONSOLIDATIONS = {
 # And make sure you have this import at the top of utils.py:
 VAULT_PATH = VAULT_BASE_PATH  # routes.py expects this name
 
+# Shared tag index - endpoints read tag counts from here instead of re-parsing every file
+TAG_INDEX = TagIndex(VAULT_PATH, CACHE_DIR)
+
 def generate_obsidian_yaml(parsed_data):
     """Generate Obsidian 1.4+ compatible YAML with multi-line arrays"""
     yaml_lines = ["---"]
@@ -125,6 +313,15 @@ def generate_obsidian_yaml(parsed_data):
 # TESSERACT 4D COORDINATE SYSTEM - CORE FUNCTIONS
 # ============================================================================
 
+# Canonical values for each dimension. Coordinates are built from these exact
+# (interned) string objects, so filters like coords["z_purpose"] == purpose and
+# dict lookups keyed on dimension values hit the identity fast path.
+TESSERACT_STRUCTURES = tuple(map(sys.intern, ("archetype", "protocol", "shadowcast", "expansion", "summoning")))
+TESSERACT_TRANSMISSIONS = tuple(map(sys.intern, ("narrative", "tarot", "image", "invocation", "text")))
+TESSERACT_PURPOSES = tuple(map(sys.intern, ("tell-story", "help-addict", "prevent-death-poverty", "financial-amends", "help-world")))
+TESSERACT_TERRAINS = tuple(map(sys.intern, ("chaotic", "confused", "complex", "complicated", "obvious")))
+TESSERACT_DIMENSIONS = ("x_structure", "y_transmission", "z_purpose", "w_terrain")
+
 def extract_tesseract_position(content: str, file_path: str = "") -> dict:
     """Extract 4D Tesseract coordinates for any document"""
     
@@ -149,7 +346,13 @@ def extract_tesseract_position(content: str, file_path: str = "") -> dict:
     }
 
     # THEN apply corrections and return
-    return apply_coordinate_corrections(file_path, initial_coordinates)
+    coordinates = apply_coordinate_corrections(file_path, initial_coordinates)
+    
+    # Share one string object per dimension value across every coordinate
+    for dimension in TESSERACT_DIMENSIONS:
+        coordinates[dimension] = sys.intern(coordinates[dimension])
+    
+    return coordinates
 
 # Enhanced coordinate extraction rules for app/utils.py
 # Add these correction rules to the extract_tesseract_position function
@@ -507,7 +710,7 @@ def calculate_4d_coherence(coordinates_list: list) -> float:
     # Weight Z-axis (purpose) most heavily for Rick's memoir project
     weighted_coherence = (x_coherence + y_coherence + z_coherence * 2 + w_coherence) / 5
     
-    return round(weighted_coherence, 3)
+    return weighted_coherence
 
 def find_tesseract_clusters(tesseract_map: dict) -> dict:
     """Find natural clusters in 4D Tesseract space"""
@@ -560,184 +763,234 @@ def generate_tesseract_folder_path(purpose: str, structure: str) -> str:
 # ENHANCED CONTENT INTELLIGENCE FUNCTIONS
 # ============================================================================
 
-def identify_document_archetype(content: str) -> str:
-    """Classify document type based on content patterns"""
-    content_lower = content.lower()
-    
+# Archetype markers in priority order - the first archetype with any marker present wins
+ARCHETYPE_MARKERS = (
     # Recovery/AA indicators (check first - Rick's core focus)
-    recovery_markers = [
+    ("recovery-document", [
         "step ", "sponsor", "meeting", "sobriety", "recovery", " aa ", " na ",
         "alcoholic", "addict", "sober", "relapse", "program", "higher power",
         "inventory", "amends", "defects", "resentment", "powerless"
-    ]
-    if any(marker in content_lower for marker in recovery_markers):
-        return "recovery-document"
-    
+    ]),
     # Memoir/narrative indicators
-    memoir_markers = [
+    ("memoir-narrative", [
         "i remember", "back then", "years ago", "childhood", "growing up",
         "my mother", "my father", "when i was", "as a child", "memoir",
         "my story", "looking back", "in those days"
-    ]
-    if any(marker in content_lower for marker in memoir_markers):
-        return "memoir-narrative"
-    
+    ]),
     # Medical/health indicators (Mayo, therapy, etc.)
-    medical_markers = [
+    ("medical-health", [
         "mayo", "doctor", "medical", "treatment", "therapy", "diagnosis",
         "cirrhosis", "liver", "medication", "appointment", "clinic",
         "therapist", "psychiatrist", "mental health", "cptsd", "trauma"
-    ]
-    if any(marker in content_lower for marker in medical_markers):
-        return "medical-health"
-    
+    ]),
     # Creative work indicators
-    creative_markers = [
+    ("creative-work", [
         "draw things", "ai art", "prompt", "generated", "creative",
         "stable diffusion", "sd", "render", "image", "artwork", "sora",
         "music", "song", "comedy", "joke", "performance"
-    ]
-    if any(marker in content_lower for marker in creative_markers):
-        return "creative-work"
-    
+    ]),
     # Technical/system indicators
-    technical_markers = [
+    ("technical-system", [
         "api", "code", "system", "endpoint", "function", "error",
         "python", "fastapi", "server", "database", "programming",
         "obsidian", "vault", "yaml", "markdown", "script"
-    ]
-    if any(marker in content_lower for marker in technical_markers):
-        return "technical-system"
-    
+    ]),
     # Philosophy/reflection indicators
-    philosophy_markers = [
+    ("philosophical-reflection", [
         "philosophy", "meaning", "existence", "consciousness", "reality",
         "god", "spiritual", "universe", "purpose", "truth", "wisdom",
         "reflection", "thoughts on", "what is", "why do we"
-    ]
-    if any(marker in content_lower for marker in philosophy_markers):
-        return "philosophical-reflection"
-    
+    ]),
     # Financial/practical life indicators
-    practical_markers = [
+    ("practical-life", [
         "money", "rent", "housing", "homeless", "shelter", "benefits",
         "medicaid", "snap", "work", "job", "income", "budget", "poor",
         "sober house", "rochester"
-    ]
-    if any(marker in content_lower for marker in practical_markers):
-        return "practical-life"
+    ]),
+)
+
+# With hyperscan, every archetype's markers go into one database and the document is scanned once;
+# ids follow ARCHETYPE_MARKERS order so the lowest matched id keeps the same priority
+if HYPERSCAN_AVAILABLE:
+    ARCHETYPE_DATABASE = hyperscan.Database()
+    ARCHETYPE_DATABASE.compile(
+        expressions=["|".join(map(re.escape, markers)).encode("utf-8") for _, markers in ARCHETYPE_MARKERS],
+        ids=list(range(len(ARCHETYPE_MARKERS))),
+        elements=len(ARCHETYPE_MARKERS),
+        flags=hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    _archetype_scratch = threading.local()
+
+def _record_archetype_match(archetype_id, start, end, flags, matched):
+    matched.add(archetype_id)
+    # The top-priority archetype cannot be beaten - stop scanning
+    return archetype_id == 0
+
+def scan_archetype_ids(content_lower: str) -> set:
+    """Ids of every archetype with a marker present, from a single hyperscan pass"""
+    scratch = getattr(_archetype_scratch, "scratch", None)
+    if scratch is None:
+        # Scratch space can't be shared between threads
+        scratch = _archetype_scratch.scratch = hyperscan.Scratch(ARCHETYPE_DATABASE)
+    matched = set()
+    try:
+        ARCHETYPE_DATABASE.scan(
+            content_lower.encode("utf-8"), match_event_handler=_record_archetype_match,
+            context=matched, scratch=scratch
+        )
+    except hyperscan.ScanTerminated:
+        pass
+    return matched
+
+def identify_document_archetype(content: str, content_lower: str = None) -> str:
+    """Classify document type based on content patterns"""
+    if content_lower is None:
+        content_lower = content.lower()
+    
+    if HYPERSCAN_AVAILABLE:
+        matched = scan_archetype_ids(content_lower)
+        return ARCHETYPE_MARKERS[min(matched)][0] if matched else "general-document"
+    
+    for archetype, markers in ARCHETYPE_MARKERS:
+        if any(marker in content_lower for marker in markers):
+            return archetype
     
     # Default to general if no clear pattern
     return "general-document"
 
-def extract_content_signature(content: str) -> dict:
+def extract_content_signature(content: str, content_lower: str = None) -> dict:
     """Extract key content characteristics for clustering"""
     lines = content.split('\n')
     words = content.split()
+    # Lowercase once and share it with every marker counter below
+    if content_lower is None:
+        content_lower = content.lower()
     
     # Count emotional language markers
-    emotional_markers = count_emotional_language(content)
+    emotional_markers = count_emotional_language(content, content_lower)
     
     # Detect temporal markers (important for memoir chronology)
-    temporal_markers = count_temporal_markers(content)
+    temporal_markers = count_temporal_markers(content, content_lower)
     
     # Find cross-references
     cross_refs = count_internal_references(content)
     
+    # Line-level structure in one pass
+    has_lists = False
+    paragraph_count = 0
+    heading_count = 0
+    for line in lines:
+        is_heading = line.startswith("#")
+        heading_count += is_heading
+        stripped = line.strip()
+        if stripped:
+            paragraph_count += not is_heading
+            has_lists = has_lists or stripped.startswith(("-", "*", "1."))
+    
     return {
         "line_count": len(lines),
         "word_count": len(words),
         "has_yaml": content.startswith("---"),
         "has_code_blocks": "```" in content,
         "has_links": "[[" in content or "http" in content,
-        "has_lists": any(line.strip().startswith(("-", "*", "1.")) for line in lines),
-        "paragraph_count": len([line for line in lines if line.strip() and not line.startswith("#")]),
-        "heading_count": len([line for line in lines if line.startswith("#")]),
+        "has_lists": has_lists,
+        "paragraph_count": paragraph_count,
+        "heading_count": heading_count,
         "question_density": content.count("?") / max(len(words), 1),
         "emotional_intensity": emotional_markers["total_score"],
         "temporal_markers": temporal_markers,
         "cross_reference_count": cross_refs,
-        "readability_score": estimate_readability(content),
-        "personal_pronouns": count_personal_pronouns(content)
+        "readability_score": estimate_readability(content, words),
+        "personal_pronouns": count_personal_pronouns(content, content_lower)
     }
 
-def count_emotional_language(content: str) -> dict:
+# Recovery-specific emotional markers
+RECOVERY_EMOTIONS = ("shame", "guilt", "fear", "anger", "resentment", "gratitude",
+                     "hope", "despair", "powerless", "surrender", "acceptance")
+
+# General emotional intensity markers
+INTENSE_EMOTIONS = ("devastated", "terrified", "overwhelmed", "desperate",
+                    "hopeless", "furious", "ecstatic", "peaceful", "serene")
+
+# Trauma/CPTSD markers
+TRAUMA_MARKERS = ("triggered", "flashback", "dissociat", "hypervigilant",
+                  "frozen", "panic", "nightmare", "intrusive")
+
+def count_emotional_language(content: str, content_lower: str = None) -> dict:
     """Count emotional markers for memoir/recovery content classification"""
-    content_lower = content.lower()
-    
-    # Recovery-specific emotional markers
-    recovery_emotions = ["shame", "guilt", "fear", "anger", "resentment", "gratitude",
-                        "hope", "despair", "powerless", "surrender", "acceptance"]
-    
-    # General emotional intensity markers
-    intense_emotions = ["devastated", "terrified", "overwhelmed", "desperate",
-                       "hopeless", "furious", "ecstatic", "peaceful", "serene"]
-    
-    # Trauma/CPTSD markers
-    trauma_markers = ["triggered", "flashback", "dissociat", "hypervigilant",
-                     "frozen", "panic", "nightmare", "intrusive"]
+    if content_lower is None:
+        content_lower = content.lower()
     
     scores = {
-        "recovery_emotional": sum(content_lower.count(word) for word in recovery_emotions),
-        "intense_emotional": sum(content_lower.count(word) for word in intense_emotions),
-        "trauma_markers": sum(content_lower.count(word) for word in trauma_markers)
+        "recovery_emotional": sum(map(content_lower.count, RECOVERY_EMOTIONS)),
+        "intense_emotional": sum(map(content_lower.count, INTENSE_EMOTIONS)),
+        "trauma_markers": sum(map(content_lower.count, TRAUMA_MARKERS))
     }
     
     scores["total_score"] = sum(scores.values())
     return scores
 
-def count_temporal_markers(content: str) -> dict:
+AGE_REFERENCE_PATTERN = re.compile(r'\b(?:age|years old|when i was) (\d+)\b', re.IGNORECASE)
+YEAR_REFERENCE_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+# Specific time periods
+CHILDHOOD_MARKERS = ("childhood", "as a child", "when i was young", "elementary", "high school")
+ADULT_MARKERS = ("college", "university", "first job", "career", "marriage", "divorce")
+RECENT_MARKERS = ("recently", "last week", "yesterday", "this morning", "today")
+
+def count_temporal_markers(content: str, content_lower: str = None) -> dict:
     """Identify temporal references for memoir chronology"""
-    content_lower = content.lower()
-    
-    # Specific time periods
-    childhood_markers = ["childhood", "as a child", "when i was young", "elementary", "high school"]
-    adult_markers = ["college", "university", "first job", "career", "marriage", "divorce"]
-    recent_markers = ["recently", "last week", "yesterday", "this morning", "today"]
+    if content_lower is None:
+        content_lower = content.lower()
     
     # Age references
-    age_pattern = re.compile(r'\b(?:age|years old|when i was) (\d+)\b', re.IGNORECASE)
-    age_matches = age_pattern.findall(content)
+    age_matches = AGE_REFERENCE_PATTERN.findall(content)
     
     # Year references
-    year_pattern = re.compile(r'\b(19\d{2}|20\d{2})\b')
-    year_matches = year_pattern.findall(content)
+    year_matches = YEAR_REFERENCE_PATTERN.findall(content)
     
     return {
-        "childhood_markers": sum(content_lower.count(marker) for marker in childhood_markers),
-        "adult_markers": sum(content_lower.count(marker) for marker in adult_markers),
-        "recent_markers": sum(content_lower.count(marker) for marker in recent_markers),
+        "childhood_markers": sum(map(content_lower.count, CHILDHOOD_MARKERS)),
+        "adult_markers": sum(map(content_lower.count, ADULT_MARKERS)),
+        "recent_markers": sum(map(content_lower.count, RECENT_MARKERS)),
         "age_references": len(age_matches),
         "year_references": len(year_matches),
         "specific_ages": [int(age) for age in age_matches if age.isdigit()],
         "specific_years": [int(year) for year in year_matches]
     }
 
+OBSIDIAN_LINK_PATTERN = re.compile(r'\[\[([^\]]+)\]\]')
+HASH_TAG_PATTERN = re.compile(r'(?<!\w)#([\w/-]+)')
+EXPLICIT_REF_PATTERNS = (
+    re.compile(r'see also:?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'related:?\s*([^\n]+)', re.IGNORECASE),
+    re.compile(r'mentioned in:?\s*([^\n]+)', re.IGNORECASE)
+)
+
 def count_internal_references(content: str) -> int:
     """Count internal links and references for relationship mapping"""
+    # Only counts matter - iterate matches rather than building lists, skip scans whose opener is absent
+    
     # Obsidian-style links
-    obsidian_links = re.findall(r'\[\[([^\]]+)\]\]', content)
+    obsidian_links = sum(1 for _ in OBSIDIAN_LINK_PATTERN.finditer(content)) if "[[" in content else 0
     
     # Hash tag references
-    hash_tags = re.findall(r'(?<!\w)#([\w/-]+)', content)
+    hash_tags = sum(1 for _ in HASH_TAG_PATTERN.finditer(content)) if "#" in content else 0
     
     # Explicit references to other documents
-    ref_patterns = [
-        r'see also:?\s*([^\n]+)',
-        r'related:?\s*([^\n]+)',
-        r'mentioned in:?\s*([^\n]+)'
-    ]
-    
-    explicit_refs = []
-    for pattern in ref_patterns:
-        explicit_refs.extend(re.findall(pattern, content, re.IGNORECASE))
+    explicit_refs = sum(
+        1 for pattern in EXPLICIT_REF_PATTERNS for _ in pattern.finditer(content)
+    )
     
-    return len(obsidian_links) + len(hash_tags) + len(explicit_refs)
+    return obsidian_links + hash_tags + explicit_refs
 
-def estimate_readability(content: str) -> float:
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+
+def estimate_readability(content: str, words: list = None) -> float:
     """Simple readability estimate (higher = more complex)"""
-    sentences = re.split(r'[.!?]+', content)
-    words = content.split()
+    sentences = SENTENCE_SPLIT_PATTERN.split(content)
+    if words is None:
+        words = content.split()
     
     if not sentences or not words:
         return 0.0
@@ -751,19 +1004,20 @@ def estimate_readability(content: str) -> float:
     # Simple readability score
     return avg_sentence_length + (complex_word_ratio * 100)
 
-def count_personal_pronouns(content: str) -> dict:
+PRONOUN_MARKERS = (
+    ("first_person", ("i ", "me ", "my ", "mine ", "myself ")),
+    ("second_person", ("you ", "your ", "yours ", "yourself ")),
+    ("third_person", ("he ", "she ", "him ", "her ", "his ", "hers ", "they ", "them "))
+)
+
+def count_personal_pronouns(content: str, content_lower: str = None) -> dict:
     """Count personal pronouns to gauge narrative perspective"""
-    content_lower = content.lower()
-    
-    pronouns = {
-        "first_person": ["i ", "me ", "my ", "mine ", "myself "],
-        "second_person": ["you ", "your ", "yours ", "yourself "],
-        "third_person": ["he ", "she ", "him ", "her ", "his ", "hers ", "they ", "them "]
-    }
+    if content_lower is None:
+        content_lower = content.lower()
     
     counts = {}
-    for category, pronoun_list in pronouns.items():
-        counts[category] = sum(content_lower.count(pronoun) for pronoun in pronoun_list)
+    for category, pronoun_list in PRONOUN_MARKERS:
+        counts[category] = sum(map(content_lower.count, pronoun_list))
     
     total = sum(counts.values())
     if total > 0:
@@ -773,18 +1027,181 @@ def count_personal_pronouns(content: str) -> dict:
     
     return counts
 
+def analyze_markdown_document(file_path: str) -> tuple:
+    """Archetype and signature for one file, as (error, results) - runs in worker processes"""
+    try:
+        content = Path(file_path).read_text(encoding="utf-8")
+        content_lower = content.lower()
+        return None, (
+            identify_document_archetype(content, content_lower),
+            extract_content_signature(content, content_lower)
+        )
+    except Exception as e:
+        return str(e), None
+
+DOCUMENT_CACHE_FILENAME = "document_cache.json"
+DOCUMENT_CACHE_VERSION = 1  # bump when archetype or signature extraction changes
+
+@dataclass
+class DocumentAnalysisCache:
+    """Per-file archetype and signature, persisted in the app cache dir and reused until the file changes"""
+    vault_path: Path
+    cache_dir: Path
+    entries: dict = field(default_factory=dict)  # relative path -> [mtime_ns, size, archetype, signature]
+    loaded: bool = False
+    dirty: bool = False
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    
+    @property
+    def sidecar_path(self) -> Path:
+        return self.cache_dir / DOCUMENT_CACHE_FILENAME
+    
+    def archetype_for(self, md_file: Path, stat) -> Optional[str]:
+        """Cached archetype of an unchanged vault file, else None"""
+        try:
+            file_key = str(md_file.relative_to(self.vault_path))
+        except ValueError:
+            return None
+        cached = self.lookup(file_key, stat.st_mtime_ns, stat.st_size)
+        return cached[0] if cached is not None else None
+    
+    def lookup(self, file_key: str, mtime_ns: int, size: int):
+        """Cached (archetype, signature) if the file is unchanged, else None"""
+        with self._lock:
+            if not self.loaded:
+                self._load()
+            entry = self.entries.get(file_key)
+            if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+                return entry[2], entry[3]
+        return None
+    
+    def store(self, file_key: str, mtime_ns: int, size: int, analysis: tuple):
+        with self._lock:
+            archetype, signature = analysis
+            self.entries[file_key] = [mtime_ns, size, archetype, signature]
+            self.dirty = True
+    
+    def retain(self, file_keys: set):
+        """Forget files that are no longer in the vault"""
+        with self._lock:
+            for file_key in self.entries.keys() - file_keys:
+                del self.entries[file_key]
+                self.dirty = True
+    
+    def save(self):
+        with self._lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            data = {"version": DOCUMENT_CACHE_VERSION, "files": self.entries}
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self.sidecar_path.write_text(json.dumps(data), encoding="utf-8")
+            except (OSError, TypeError, ValueError):
+                # Unwritable cache dir - keep the in-memory cache
+                pass
+    
+    def _load(self):
+        self.loaded = True
+        try:
+            data = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+            if data.get("version") == DOCUMENT_CACHE_VERSION:
+                self.entries.update(data.get("files", {}))
+        except (OSError, ValueError, TypeError, AttributeError):
+            # Missing, unreadable or outdated sidecar - rebuild from the vault
+            pass
+
+DOCUMENT_CACHE = DocumentAnalysisCache(VAULT_PATH, CACHE_DIR)
+
 # ============================================================================
 # FOLDER STRUCTURE ANALYSIS
 # ============================================================================
 
+def walk_vault(root: Path):
+    """Yield (directory, subdirectories, markdown DirEntries) per folder, in the same order rglob visits them"""
+    # scandir's DirEntry carries the file type, so telling folders from files costs no extra stat
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+        subdirectories = []
+        md_entries = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                    continue
+            except OSError:
+                continue
+            if entry.name.endswith(".md"):
+                md_entries.append(entry)
+        yield directory, subdirectories, md_entries
+        # Depth-first, first subdirectory next
+        stack.extend(reversed(subdirectories))
+
+def vault_markdown_files(root: Path) -> list:
+    """Every markdown file under root, like list(root.rglob("*.md"))"""
+    return [Path(entry.path) for _, _, md_entries in walk_vault(root) for entry in md_entries]
+
+@dataclass
+class VaultScan:
+    """One walk of the vault, shared by the content and folder analyses"""
+    md_files: list = field(default_factory=list)              # rglob("*.md") order
+    md_stats: list = field(default_factory=list)              # os.stat_result per file, None if stat failed
+    md_files_by_folder: dict = field(default_factory=dict)    # folder path -> its markdown files
+    folder_order: list = field(default_factory=list)          # folder paths in rglob("*") order
+    
+    @property
+    def fingerprint(self) -> int:
+        """Change marker for the vault: hash of every markdown file's (path, mtime_ns, size), so renames and moves count too"""
+        return hash(tuple(sorted(
+            (str(md_file), stat.st_mtime_ns, stat.st_size) if stat is not None else (str(md_file), 0, -1)
+            for md_file, stat in zip(self.md_files, self.md_stats)
+        )))
+
+def scan_vault(root: Path) -> VaultScan:
+    """Walk the vault once, collecting markdown files, their stats and the folder layout"""
+    scan = VaultScan()
+    for directory, subdirectories, md_entries in walk_vault(root):
+        folder_files = []
+        for entry in md_entries:
+            md_file = Path(entry.path)
+            try:
+                stat = entry.stat()
+            except OSError:
+                stat = None
+            scan.md_files.append(md_file)
+            scan.md_stats.append(stat)
+            folder_files.append(md_file)
+        scan.md_files_by_folder[directory] = folder_files
+        # A folder's subfolders are listed when the folder itself is visited, as rglob("*") does
+        scan.folder_order.extend(subdirectories)
+    return scan
+
+@lru_cache(maxsize=4096)
+def _cached_file_archetype(file_path: str, mtime_ns: int, size: int) -> str:
+    return identify_document_archetype(Path(file_path).read_text(encoding="utf-8"))
+
+def file_archetype(md_file: Path) -> str:
+    """Archetype of a markdown file, memoized until its mtime or size changes"""
+    stat = md_file.stat()
+    # Content fingerprinting has usually classified the file already
+    archetype = DOCUMENT_CACHE.archetype_for(md_file, stat)
+    if archetype is not None:
+        return archetype
+    return _cached_file_archetype(str(md_file), stat.st_mtime_ns, stat.st_size)
+
 def analyze_folder_content_types(md_files: list) -> dict:
     """Analyze the content types within a folder"""
     content_types = Counter()
     
     for md_file in md_files:
         try:
-            content = md_file.read_text(encoding="utf-8")
-            archetype = identify_document_archetype(content)
+            archetype = file_archetype(md_file)
             content_types[archetype] += 1
         except Exception:
             content_types["unreadable"] += 1
@@ -798,19 +1215,18 @@ def analyze_folder_content_types(md_files: list) -> dict:
 
 def measure_tag_coherence(md_files: list) -> float:
     """Measure how coherent the tags are within a folder"""
-    all_tags = []
+    tag_counter = Counter()
     
+    # Unchanged files come straight from the tag index - one stat instead of a read and YAML parse
     for md_file in md_files:
         try:
-            tags = extract_all_tags(md_file)
-            all_tags.extend(tags)
+            tag_counter.update(TAG_INDEX.tags_for(md_file))
         except Exception:
             continue
     
-    if not all_tags:
+    if not tag_counter:
         return 0.0
     
-    tag_counter = Counter(all_tags)
     unique_tags = len(tag_counter)
     total_tag_instances = sum(tag_counter.values())
     
@@ -818,24 +1234,21 @@ def measure_tag_coherence(md_files: list) -> float:
     coherence = 1.0 - (unique_tags / total_tag_instances) if total_tag_instances > 0 else 0.0
     return max(0.0, min(1.0, coherence))
 
+DATE_NAME_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+NUMBER_NAME_PATTERN = re.compile(r'\d+')
+
 def extract_naming_patterns(md_files: list) -> dict:
     """Extract naming patterns from filenames"""
     filenames = [f.stem for f in md_files]
     
     # Common prefixes
-    prefixes = defaultdict(int)
-    for name in filenames:
-        parts = name.split('-')
-        if len(parts) > 1:
-            prefixes[parts[0]] += 1
+    prefixes = Counter(name.partition('-')[0] for name in filenames if '-' in name)
     
     # Date patterns
-    date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}')
-    date_files = [name for name in filenames if date_pattern.search(name)]
+    date_files = [name for name in filenames if DATE_NAME_PATTERN.search(name)]
     
     # Number patterns
-    number_pattern = re.compile(r'\d+')
-    numbered_files = [name for name in filenames if number_pattern.search(name)]
+    numbered_files = [name for name in filenames if NUMBER_NAME_PATTERN.search(name)]
     
     return {
         "total_files": len(filenames),
@@ -899,11 +1312,11 @@ def generate_folder_path(archetype: str) -> str:
     
     return folder_mappings.get(archetype, "unsorted/needs-classification")
 
+HIGH_PRIORITY_ARCHETYPES = frozenset({"recovery-document", "memoir-narrative", "medical-health"})
+
 def calculate_priority(archetype: str, file_count: int) -> str:
     """Calculate reorganization priority"""
-    high_priority_types = ["recovery-document", "memoir-narrative", "medical-health"]
-    
-    if archetype in high_priority_types and file_count > 10:
+    if archetype in HIGH_PRIORITY_ARCHETYPES and file_count > 10:
         return "high"
     elif file_count > 25:
         return "high"
@@ -930,8 +1343,10 @@ def find_orphaned_files(folder_analysis: dict) -> list:
 
 def chunked(iterable, size):
     """Yield successive chunks of specified size from iterable"""
-    for i in range(0, len(iterable), size):
-        yield iterable[i:i + size]
+    # islice pulls straight from the iterator, so generators are batched without materializing them first
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 # ============================================================================
 # EXISTING TAG FUNCTIONS (PRESERVED)
@@ -964,19 +1379,19 @@ def apply_tag_consolidation(content: str, tag_mappings: dict) -> tuple[str, list
                 if isinstance(original_tags, list):
                     updated_tags = []
                     for tag in original_tags:
-                        new_tag = tag_mappings.get(str(tag), str(tag))
-                        if str(new_tag) != str(tag):
+                        tag_str = str(tag)
+                        new_tag = tag_mappings.get(tag_str, tag_str)
+                        if str(new_tag) != tag_str:
                             changes.append(f"YAML tag: {tag} -> {new_tag}")
                         updated_tags.append(new_tag)
                     
                     yaml_data['tags'] = sorted(set(updated_tags))
                     
                     # Rebuild content with new YAML
-                    lines = content.split('\n')
-                    yaml_end = next((i for i, line in enumerate(lines[1:], 1) if line.strip() == "---"), -1)
-                    if yaml_end > 0:
+                    yaml_block, body = _split_frontmatter(content)
+                    if yaml_block is not None:
                         new_yaml = generate_obsidian_yaml(yaml_data)
-                        updated_content = new_yaml + '\n' + '\n'.join(lines[yaml_end + 1:])
+                        updated_content = new_yaml + '\n' + body
         except Exception as e:
             changes.append(f"YAML repair attempted: {str(e)}")
     
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routes import router as upload_router
 
 app = FastAPI(
@@ -17,5 +18,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger HTML pages and JSON payloads; small responses aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Now add the router
 app.include_router(upload_router)
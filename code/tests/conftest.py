@@ -0,0 +1,47 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# app.config reads these paths at import time, so point them at a throwaway vault and
+# cache dir before any test module imports the app
+TEST_ROOT = Path(tempfile.mkdtemp(prefix="flatdrop-tests-"))
+TEST_VAULT = TEST_ROOT / "vault"
+TEST_VAULT.mkdir()
+TEST_CACHE_DIR = TEST_ROOT / "cache"
+os.environ["FLATDROP_VAULT_PATH"] = str(TEST_VAULT)
+os.environ["FLATDROP_CACHE_DIR"] = str(TEST_CACHE_DIR)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_ROOT, ignore_errors=True)
+
+
+def run(coro):
+    """Drive a route coroutine to completion"""
+    return asyncio.run(coro)
+
+
+def write_note(vault: Path, relative_path: str, content: str) -> Path:
+    """Write a markdown note into the test vault"""
+    note = vault / relative_path
+    note.parent.mkdir(parents=True, exist_ok=True)
+    note.write_text(content, encoding="utf-8")
+    return note
+
+
+@pytest.fixture
+def vault():
+    """Empty test vault, with every analysis cache dropped"""
+    from app import routes
+
+    for child in TEST_VAULT.iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+    routes.invalidate_tesseract_cache()
+    yield TEST_VAULT
@@ -0,0 +1,35 @@
+from app import routes
+from app.schemas import BatchMoveRequest
+from tests.conftest import run, write_note
+
+
+def batch_move(*moves):
+    request = BatchMoveRequest(moves=[
+        {"source_path": source, "destination_path": destination} for source, destination in moves
+    ])
+    return run(routes.batch_move_files(request))
+
+
+def test_failed_move_is_reported_per_move(vault):
+    write_note(vault, "a.md", "# A\n")
+    write_note(vault, "b.md", "# B\n")
+    write_note(vault, "c.md", "# C\n")  # a file where the second move needs a folder
+    corpus_version = routes._corpus_version
+
+    result = batch_move(("a.md", "new/a.md"), ("b.md", "c.md/b.md"))
+
+    assert result["status"] == "success"
+    assert result["successful_moves"] == 1
+    assert [r["status"] for r in result["move_results"]] == ["success", "error"]
+    assert (vault / "new/a.md").is_file()
+    assert (vault / "b.md").is_file()
+    assert routes._corpus_version > corpus_version
+
+
+def test_chained_moves_keep_request_order(vault):
+    write_note(vault, "a.md", "# A\n")
+
+    result = batch_move(("a.md", "b.md"), ("b.md", "done/c.md"), ("missing.md", "x.md"))
+
+    assert [r["status"] for r in result["move_results"]] == ["success", "success", "error"]
+    assert (vault / "done/c.md").read_text(encoding="utf-8") == "# A\n"
@@ -0,0 +1,37 @@
+from app import routes
+from main import app
+from tests.conftest import run, write_note
+
+
+def test_document_pool_is_shared_across_requests(vault):
+    write_note(vault, "notes/first.md", "# First\n\nA protocol for the morning.\n")
+    try:
+        first = run(routes.analyze_content_patterns())
+        pool = routes._document_pool
+        assert pool is not None
+
+        write_note(vault, "notes/second.md", "# Second\n\nA memoir chapter.\n")
+        second = run(routes.analyze_content_patterns())
+
+        assert routes._document_pool is pool
+        assert second["analysis_summary"]["total_files_processed"] == first["analysis_summary"]["total_files_processed"] + 1
+    finally:
+        routes.shutdown_document_pool()
+
+    assert routes._document_pool is None
+
+
+def test_document_pool_stops_with_the_app():
+    assert routes.shutdown_document_pool in app.router.on_shutdown
+
+
+def test_document_cache_is_persisted_outside_the_vault(vault):
+    write_note(vault, "notes/first.md", "# First\n\nA protocol for the morning.\n")
+    try:
+        run(routes.analyze_content_patterns())
+    finally:
+        routes.shutdown_document_pool()
+
+    assert routes.DOCUMENT_CACHE.sidecar_path.is_file()
+    assert vault not in routes.DOCUMENT_CACHE.sidecar_path.parents
+    assert [path.name for path in vault.rglob("*") if path.is_file()] == ["first.md"]
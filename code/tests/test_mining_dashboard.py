@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from app import routes
+from tests.conftest import run, write_note
+
+
+@pytest.fixture
+def inload_vault(vault):
+    write_note(vault, "_inload/docs/recovery.md", "# Recovery\n\nDay one of recovery, sobriety and healing.\n")
+    write_note(vault, "_inload/docs/job.md", "# Job search\n\nResume, interview and job application notes.\n")
+    return vault
+
+
+def test_msgpack_unavailable_returns_501(inload_vault, monkeypatch):
+    monkeypatch.setattr(routes, "ORMSGPACK_AVAILABLE", False)
+
+    response = run(routes.get_mining_dashboard(format="msgpack"))
+
+    assert response.status_code == 501
+    assert json.loads(response.body)["status"] == "error"
+
+
+def test_msgpack_matches_json_payload(inload_vault):
+    ormsgpack = pytest.importorskip("ormsgpack")
+    assert routes.ORMSGPACK_AVAILABLE
+
+    packed = run(routes.get_mining_dashboard(format="msgpack"))
+    as_json = run(routes.get_mining_dashboard(format="json"))
+
+    assert packed.status_code == 200
+    assert packed.media_type == "application/x-msgpack"
+    payload = ormsgpack.unpackb(packed.body)
+    assert payload == json.loads(as_json.body)
+    assert payload["overview"]["total_files"] == 2
+
+
+class FakeMiner:
+    mining_results = {
+        "high_value": [{"path": f"note-{quality}.md", "quality": quality} for quality in (3, 9, 1, 7, 5)]
+    }
+
+
+def priority_paths(monkeypatch, limit):
+    async def get_fake_miner(refresh=False):
+        return FakeMiner()
+
+    monkeypatch.setattr(routes, "get_inload_miner", get_fake_miner)
+    result = run(routes.get_priority_inload_files(category="high_value", limit=limit))
+    return [file["path"] for file in result["files"]]
+
+
+def test_priority_files_top_limit(monkeypatch):
+    assert priority_paths(monkeypatch, 2) == ["note-9.md", "note-7.md"]
+
+
+def test_priority_files_negative_limit_drops_the_lowest(monkeypatch):
+    assert priority_paths(monkeypatch, -2) == ["note-9.md", "note-7.md", "note-5.md"]
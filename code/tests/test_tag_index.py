@@ -0,0 +1,49 @@
+import os
+
+from app.utils import TagIndex
+from tests.conftest import write_note
+
+
+def tagged(*tags):
+    return "---\ntags:\n" + "".join(f"- {tag}\n" for tag in tags) + "---\n# Note\n"
+
+
+def edit_externally(note, content):
+    """Rewrite a note the way an editor would, with a visibly newer mtime"""
+    mtime_ns = note.stat().st_mtime_ns
+    note.write_text(content, encoding="utf-8")
+    os.utime(note, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+
+def test_refresh_picks_up_external_edits(vault, tmp_path):
+    kept = write_note(vault, "notes/kept.md", tagged("memoir", "draft"))
+    deleted = write_note(vault, "notes/deleted.md", tagged("draft"))
+    index = TagIndex(vault, tmp_path / "cache")
+    assert index.counts() == {"memoir": 1, "draft": 2}
+
+    edit_externally(kept, tagged("memoir", "final"))
+    deleted.unlink()
+    write_note(vault, "notes/added.md", tagged("final", "recovery"))
+
+    assert index.counts() == {"memoir": 1, "final": 2, "recovery": 1}
+    assert index.tag_to_files["final"] == {"notes/kept.md", "notes/added.md"}
+    assert "draft" not in index.tag_to_files
+
+
+def test_persisted_index_catches_edits_made_while_stopped(vault, tmp_path):
+    note = write_note(vault, "notes/note.md", tagged("draft"))
+    TagIndex(vault, tmp_path / "cache").counts()
+
+    edit_externally(note, tagged("final"))
+
+    assert TagIndex(vault, tmp_path / "cache").counts() == {"final": 1}
+
+
+def test_index_is_persisted_outside_the_vault(vault, tmp_path):
+    write_note(vault, "notes/note.md", tagged("draft"))
+    index = TagIndex(vault, tmp_path / "cache")
+    index.counts()
+
+    assert index.sidecar_path.is_file()
+    assert index.sidecar_path.parent == tmp_path / "cache"
+    assert [path.name for path in vault.rglob("*") if path.is_file()] == ["note.md"]
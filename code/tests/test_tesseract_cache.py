@@ -0,0 +1,107 @@
+import sys
+import types
+
+from app import routes
+from tests.conftest import run, write_note
+
+
+class FakeIncrementalProcessor:
+    """Stands in for IncrementalProcessor: a real run drops one new note into the vault"""
+
+    vault = None
+
+    def __init__(self, source_dir, output_base, backup_dir, processed_log):
+        pass
+
+    def process_new_files(self, dry_run=True):
+        if not dry_run:
+            write_note(self.vault, "memoir/ingested.md", "# Ingested\n\nA memoir chapter about recovery.\n")
+        return {"status": "success", "dry_run": dry_run}
+
+
+def ingest(vault, monkeypatch, dry_run):
+    monkeypatch.setattr(FakeIncrementalProcessor, "vault", vault)
+    fake_module = types.ModuleType("app.incremental_processor")
+    fake_module.IncrementalProcessor = FakeIncrementalProcessor
+    monkeypatch.setitem(sys.modules, "app.incremental_processor", fake_module)
+    return run(routes.run_incremental_processing(dry_run=dry_run))
+
+
+def test_ingest_refreshes_coordinates(vault, monkeypatch):
+    write_note(vault, "notes/existing.md", "# Existing\n\nA protocol for the morning.\n")
+    before = run(routes._cached_tesseract_coordinates())
+    assert list(before["coordinate_combinations"]) == ["notes/existing.md"]
+
+    ingest(vault, monkeypatch, dry_run=False)
+
+    after = run(routes._cached_tesseract_coordinates())
+    assert after is not before
+    assert set(after["coordinate_combinations"]) == {"notes/existing.md", "memoir/ingested.md"}
+
+
+def test_dry_run_ingest_keeps_cache(vault, monkeypatch):
+    write_note(vault, "notes/existing.md", "# Existing\n\nA protocol for the morning.\n")
+    before = run(routes._cached_tesseract_coordinates())
+
+    ingest(vault, monkeypatch, dry_run=True)
+
+    assert run(routes._cached_tesseract_coordinates()) is before
+
+
+def test_tag_rewrite_invalidates_coordinates(vault):
+    write_note(vault, "notes/tagged.md", "---\ntags:\n- flatline\n- morning\n---\n# Tagged\n\nBody.\n")
+    before = run(routes._cached_tesseract_coordinates())
+
+    result = run(routes.consolidate_tesseract_redundant_tags(dry_run=False))
+
+    assert result["total_changes"] > 0
+    assert run(routes._cached_tesseract_coordinates()) is not before
+
+
+def test_external_rename_changes_vault_fingerprint(vault):
+    write_note(vault, "notes/a.md", "# A\n")
+    write_note(vault, "notes/b.md", "# B\n")
+    before = routes.scan_vault(vault)
+
+    (vault / "archive").mkdir()
+    (vault / "notes/a.md").rename(vault / "archive/a.md")  # same count, same mtimes
+    after = routes.scan_vault(vault)
+
+    assert after.fingerprint != before.fingerprint
+    assert routes.scan_vault(vault).fingerprint == after.fingerprint
+
+
+def test_external_rename_invalidates_vault_analysis(vault):
+    write_note(vault, "notes/a.md", "# A\n")
+
+    async def list_files(scan):
+        return {"files": sorted(str(md_file.relative_to(vault)) for md_file in scan.md_files)}
+
+    first = run(routes._cached_vault_analysis("test-files", list_files, routes.scan_vault(vault)))
+    assert run(routes._cached_vault_analysis("test-files", list_files, routes.scan_vault(vault))) is first
+
+    (vault / "notes/a.md").rename(vault / "notes/renamed.md")
+
+    second = run(routes._cached_vault_analysis("test-files", list_files, routes.scan_vault(vault)))
+    assert second["files"] == ["notes/renamed.md"]
+
+
+def test_external_edit_refreshes_coordinates(vault):
+    write_note(vault, "notes/existing.md", "# Existing\n\nA protocol for the morning.\n")
+    before = run(routes._cached_tesseract_coordinates())
+    assert run(routes._cached_tesseract_coordinates()) is before
+
+    write_note(vault, "notes/outside.md", "# Outside\n\nWritten by another editor.\n")
+
+    after = run(routes._cached_tesseract_coordinates())
+    assert set(after["coordinate_combinations"]) == {"notes/existing.md", "notes/outside.md"}
+
+
+def test_external_edit_refreshes_memoir_readiness(vault):
+    write_note(vault, "notes/existing.md", "# Existing\n\nA protocol for the morning.\n")
+    before = run(routes.assess_tesseract_memoir_readiness())
+    assert run(routes.assess_tesseract_memoir_readiness()) is before
+
+    write_note(vault, "memoir/chapter.md", "# Chapter\n\nI remember growing up, a memoir of recovery.\n")
+
+    assert run(routes.assess_tesseract_memoir_readiness()) is not before
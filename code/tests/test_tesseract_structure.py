@@ -0,0 +1,21 @@
+from app import routes
+from tests.conftest import run, write_note
+
+
+def test_folders_keep_walk_order_and_count_every_note(vault):
+    write_note(vault, "zeta/one.md", "# One\n\nA protocol for the morning.\n")
+    write_note(vault, "zeta/inner/two.md", "# Two\n\nA memoir chapter.\n")
+    write_note(vault, "alpha/three.md", "# Three\n\nNotes on recovery.\n")
+    (vault / "alpha/unreadable.md").write_bytes(b"\xff\xfe not utf-8")
+
+    result = run(routes.analyze_tesseract_structure())
+    folders = result["tesseract_structure_analysis"]["dimensional_coherence"]
+
+    expected_order = [
+        str(folder.relative_to(vault))
+        for folder in vault.rglob("*")
+        if folder.is_dir() and any(folder.glob("*.md"))
+    ]
+    assert list(folders) == expected_order
+    assert folders["alpha"]["file_count"] == 2
+    assert folders["zeta"]["file_count"] == 1